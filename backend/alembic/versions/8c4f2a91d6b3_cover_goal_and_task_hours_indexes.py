@@ -0,0 +1,37 @@
+"""Cover goal and task hours in the parent-id indexes
+
+Revision ID: 8c4f2a91d6b3
+Revises: 5ed197308e1d
+Create Date: 2026-10-15 09:12:41.204517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4f2a91d6b3'
+down_revision: Union[str, Sequence[str], None] = '5ed197308e1d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # INCLUDE weekly_hours so the allocation SUMs run as index-only scans;
+    # these replace the plain parent-id indexes, which they fully cover
+    op.create_index('ix_goal_project_id_hours', 'goal', ['project_id'], unique=False,
+                    postgresql_include=['weekly_hours'])
+    op.drop_index(op.f('ix_goal_project_id'), table_name='goal')
+    op.create_index('ix_task_goal_id_hours', 'task', ['goal_id'], unique=False,
+                    postgresql_include=['weekly_hours'])
+    op.drop_index(op.f('ix_task_goal_id'), table_name='task')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_task_goal_id'), 'task', ['goal_id'], unique=False)
+    op.drop_index('ix_task_goal_id_hours', table_name='task')
+    op.create_index(op.f('ix_goal_project_id'), 'goal', ['project_id'], unique=False)
+    op.drop_index('ix_goal_project_id_hours', table_name='goal')
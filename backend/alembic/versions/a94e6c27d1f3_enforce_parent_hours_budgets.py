@@ -0,0 +1,83 @@
+"""Enforce weekly hours allocation when a parent's budget shrinks
+
+Revision ID: a94e6c27d1f3
+Revises: f2c71b9d4e08
+Create Date: 2026-10-15 18:42:09.113604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a94e6c27d1f3'
+down_revision: Union[str, Sequence[str], None] = 'f2c71b9d4e08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The child-side triggers from b71e09c3a5f4 only fire when a goal or task
+    # is written. These cover the parent side: lowering a project's or goal's
+    # weekly_hours below what its children already use. The UPDATE holds the
+    # parent row lock until COMMIT, and the child-side checks lock the same
+    # row, so the two sides are serialized and the later one sees the earlier
+    # one's committed rows.
+    op.execute("""
+        CREATE FUNCTION check_project_hours_cover_goals() RETURNS trigger AS $$
+        DECLARE
+            budget double precision;
+            allocated double precision;
+        BEGIN
+            SELECT weekly_hours INTO budget FROM project WHERE id = NEW.id;
+            SELECT COALESCE(SUM(weekly_hours), 0) INTO allocated
+                FROM goal WHERE project_id = NEW.id;
+            IF allocated > budget THEN
+                RAISE EXCEPTION 'Goal hours (%) exceed project % allocation (%)',
+                    allocated, NEW.id, budget
+                    USING ERRCODE = 'check_violation';
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE CONSTRAINT TRIGGER project_hours_cover_goals
+            AFTER UPDATE OF weekly_hours ON project
+            DEFERRABLE INITIALLY DEFERRED
+            FOR EACH ROW EXECUTE FUNCTION check_project_hours_cover_goals();
+    """)
+    op.execute("""
+        CREATE FUNCTION check_goal_hours_cover_tasks() RETURNS trigger AS $$
+        DECLARE
+            budget double precision;
+            allocated double precision;
+        BEGIN
+            SELECT weekly_hours INTO budget FROM goal WHERE id = NEW.id;
+            SELECT COALESCE(SUM(weekly_hours), 0) INTO allocated
+                FROM task WHERE goal_id = NEW.id;
+            IF allocated > budget THEN
+                RAISE EXCEPTION 'Task hours (%) exceed goal % allocation (%)',
+                    allocated, NEW.id, budget
+                    USING ERRCODE = 'check_violation';
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE CONSTRAINT TRIGGER goal_hours_cover_tasks
+            AFTER UPDATE OF weekly_hours ON goal
+            DEFERRABLE INITIALLY DEFERRED
+            FOR EACH ROW EXECUTE FUNCTION check_goal_hours_cover_tasks();
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER goal_hours_cover_tasks ON goal")
+    op.execute("DROP FUNCTION check_goal_hours_cover_tasks()")
+    op.execute("DROP TRIGGER project_hours_cover_goals ON project")
+    op.execute("DROP FUNCTION check_project_hours_cover_goals()")
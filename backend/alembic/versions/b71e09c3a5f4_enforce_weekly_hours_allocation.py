@@ -0,0 +1,81 @@
+"""Enforce weekly hours allocation with constraint triggers
+
+Revision ID: b71e09c3a5f4
+Revises: 8c4f2a91d6b3
+Create Date: 2026-10-15 10:03:17.551932
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b71e09c3a5f4'
+down_revision: Union[str, Sequence[str], None] = '8c4f2a91d6b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Each check locks the parent row before summing its children, so
+    # concurrent transactions adding to the same parent are checked one after
+    # the other and the later one sees the earlier one's committed rows.
+    # The triggers are deferred, so they run once at COMMIT.
+    op.execute("""
+        CREATE FUNCTION check_goal_hours_within_project() RETURNS trigger AS $$
+        DECLARE
+            budget double precision;
+            allocated double precision;
+        BEGIN
+            SELECT weekly_hours INTO budget FROM project WHERE id = NEW.project_id FOR UPDATE;
+            SELECT COALESCE(SUM(weekly_hours), 0) INTO allocated
+                FROM goal WHERE project_id = NEW.project_id;
+            IF allocated > budget THEN
+                RAISE EXCEPTION 'Goal hours (%) exceed project % allocation (%)',
+                    allocated, NEW.project_id, budget
+                    USING ERRCODE = 'check_violation';
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE CONSTRAINT TRIGGER goal_hours_within_project
+            AFTER INSERT OR UPDATE OF weekly_hours, project_id ON goal
+            DEFERRABLE INITIALLY DEFERRED
+            FOR EACH ROW EXECUTE FUNCTION check_goal_hours_within_project();
+    """)
+    op.execute("""
+        CREATE FUNCTION check_task_hours_within_goal() RETURNS trigger AS $$
+        DECLARE
+            budget double precision;
+            allocated double precision;
+        BEGIN
+            SELECT weekly_hours INTO budget FROM goal WHERE id = NEW.goal_id FOR UPDATE;
+            SELECT COALESCE(SUM(weekly_hours), 0) INTO allocated
+                FROM task WHERE goal_id = NEW.goal_id;
+            IF allocated > budget THEN
+                RAISE EXCEPTION 'Task hours (%) exceed goal % allocation (%)',
+                    allocated, NEW.goal_id, budget
+                    USING ERRCODE = 'check_violation';
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE CONSTRAINT TRIGGER task_hours_within_goal
+            AFTER INSERT OR UPDATE OF weekly_hours, goal_id ON task
+            DEFERRABLE INITIALLY DEFERRED
+            FOR EACH ROW EXECUTE FUNCTION check_task_hours_within_goal();
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER task_hours_within_goal ON task")
+    op.execute("DROP FUNCTION check_task_hours_within_goal()")
+    op.execute("DROP TRIGGER goal_hours_within_project ON goal")
+    op.execute("DROP FUNCTION check_goal_hours_within_project()")
@@ -0,0 +1,35 @@
+"""Index chore and habit due dates per user
+
+Revision ID: d3a8e6f0b142
+Revises: b71e09c3a5f4
+Create Date: 2026-10-15 14:37:05.861293
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3a8e6f0b142'
+down_revision: Union[str, Sequence[str], None] = 'b71e09c3a5f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # (user_id, next_due_date) turns the /due queries into a range scan;
+    # its user_id prefix also covers the plain per-user indexes it replaces
+    op.create_index('ix_chore_user_next_due', 'chore', ['user_id', 'next_due_date'], unique=False)
+    op.drop_index(op.f('ix_chore_user_id'), table_name='chore')
+    op.create_index('ix_habit_user_next_due', 'habit', ['user_id', 'next_due_date'], unique=False)
+    op.drop_index(op.f('ix_habit_user_id'), table_name='habit')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_habit_user_id'), 'habit', ['user_id'], unique=False)
+    op.drop_index('ix_habit_user_next_due', table_name='habit')
+    op.create_index(op.f('ix_chore_user_id'), 'chore', ['user_id'], unique=False)
+    op.drop_index('ix_chore_user_next_due', table_name='chore')
@@ -0,0 +1,45 @@
+"""Index user-owned names per user, case-insensitively
+
+Revision ID: f2c71b9d4e08
+Revises: d3a8e6f0b142
+Create Date: 2026-10-15 16:05:48.337190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c71b9d4e08'
+down_revision: Union[str, Sequence[str], None] = 'd3a8e6f0b142'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NAMED_TABLES = ('project', 'goal', 'task', 'chore', 'habit')
+
+# Chore and habit lost their plain user_id indexes to the due-date indexes
+USER_ID_INDEXED_TABLES = ('project', 'goal', 'task')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # (user_id, lower(name)) serves per-user listings through its prefix and
+    # case-insensitive name lookups within a user, replacing the separate
+    # single-column name and user_id indexes
+    for table in NAMED_TABLES:
+        op.create_index(f'ix_{table}_user_lower_name', table,
+                        ['user_id', sa.text('lower(name)')], unique=False)
+        op.drop_index(op.f(f'ix_{table}_name'), table_name=table)
+    for table in USER_ID_INDEXED_TABLES:
+        op.drop_index(op.f(f'ix_{table}_user_id'), table_name=table)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in USER_ID_INDEXED_TABLES:
+        op.create_index(op.f(f'ix_{table}_user_id'), table, ['user_id'], unique=False)
+    for table in NAMED_TABLES:
+        op.create_index(op.f(f'ix_{table}_name'), table, ['name'], unique=False)
+        op.drop_index(f'ix_{table}_user_lower_name', table_name=table)
@@ -1,45 +1,57 @@
 """
 Authentication API endpoints.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select
+from fastapi import APIRouter, Depends, Form, HTTPException, status
+from sqlalchemy import bindparam
+from sqlmodel import or_, select
 
-from app.core.database import get_session
-from app.core.security import create_access_token, verify_password, get_password_hash, verify_token
-from app.core.auth import get_current_user
+from app.core.database import get_request_session
+from app.core.response_cache import cached_response
+from app.core.security import (
+    create_access_token,
+    get_password_hash,
+    run_in_password_pool,
+    verify_user_password,
+)
+from app.core.auth import get_request_user
 from app.models.user import User, UserCreate, UserRead
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
+# Statements built once at import and executed with bound parameters
+_TAKEN_USERNAMES = select(User.username).where(
+    or_(User.username == bindparam("username"), User.email == bindparam("email"))
+)
+
+_USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+
 
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-async def register(
-    user_data: UserCreate,
-    session: AsyncSession = Depends(get_session),
-):
+async def register(user_data: UserCreate):
     """Register a new user."""
-    # Check if username already exists
-    username_stmt = select(User).where(User.username == user_data.username)
-    username_result = await session.execute(username_stmt)
-    if username_result.scalar_one_or_none():
+    session = get_request_session()
+    
+    # Check username and email in one query; both columns are unique, so at
+    # most two rows can match
+    taken_result = await session.execute(
+        _TAKEN_USERNAMES, {"username": user_data.username, "email": user_data.email}
+    )
+    taken_usernames = taken_result.scalars().all()
+    
+    if user_data.username in taken_usernames:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already registered"
         )
     
-    # Check if email already exists
-    email_stmt = select(User).where(User.email == user_data.email)
-    email_result = await session.execute(email_stmt)
-    if email_result.scalar_one_or_none():
+    if taken_usernames:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await run_in_password_pool(get_password_hash, user_data.password)
     user = User(
         username=user_data.username,
         email=user_data.email,
@@ -48,23 +60,24 @@ async def register(
     
     session.add(user)
     await session.commit()
-    await session.refresh(user)
     
     return user
 
 
 @router.post("/login")
 async def login(
-    form_data: OAuth2PasswordRequestForm = Depends(),
-    session: AsyncSession = Depends(get_session),
+    username: str = Form(...),
+    password: str = Form(...),
 ):
     """Login and get access token."""
+    session = get_request_session()
+    
     # Find user by username
-    stmt = select(User).where(User.username == form_data.username)
-    result = await session.execute(stmt)
-    user = result.scalar_one_or_none()
+    user = await session.scalar(_USER_BY_USERNAME, {"username": username})
     
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    # Always run bcrypt, even for unknown usernames, so timing doesn't leak them
+    hashed_password = user.hashed_password if user else None
+    if not await run_in_password_pool(verify_user_password, password, hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -87,7 +100,7 @@ async def login(
 
 @router.post("/refresh")
 async def refresh_token(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_request_user),
 ):
     """Refresh access token for authenticated user."""
     access_token = create_access_token(subject=str(current_user.id))
@@ -99,8 +112,9 @@ async def refresh_token(
 
 
 @router.get("/me", response_model=UserRead)
+@cached_response(UserRead)
 async def get_current_user_info(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_request_user),
 ):
     """Get current user information."""
     return current_user
\ No newline at end of file
@@ -5,10 +5,11 @@ from datetime import date
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import StreamingResponse
 
-from app.core.auth import get_current_user
-from app.core.database import get_session
+from app.core.auth import get_request_user
+from app.core.response_cache import cached_response
+from app.core.streaming import json_array_response
 from app.models.recurring import (
     Chore,
     ChoreComplete,
@@ -22,103 +23,93 @@ from app.repositories.chore import ChoreRepository
 router = APIRouter(prefix="/chores", tags=["chores"])
 
 
-def get_chore_repository(session: AsyncSession = Depends(get_session)) -> ChoreRepository:
-    """Dependency to get chore repository."""
-    return ChoreRepository(session)
-
-
 @router.post("/", response_model=ChoreRead, status_code=status.HTTP_201_CREATED)
 async def create_chore(
     chore_data: ChoreCreate,
-    current_user: User = Depends(get_current_user),
-    chore_repo: ChoreRepository = Depends(get_chore_repository),
+    current_user: User = Depends(get_request_user),
 ) -> ChoreRead:
     """Create a new chore."""
+    chore_repo = ChoreRepository()
     chore = await chore_repo.create(chore_data, current_user.id)
-    return ChoreRead.model_validate(chore)
+    return ChoreRead.from_orm_fast(chore)
 
 
 @router.get("/", response_model=List[ChoreRead])
 async def get_chores(
-    current_user: User = Depends(get_current_user),
-    chore_repo: ChoreRepository = Depends(get_chore_repository),
-) -> List[ChoreRead]:
+    current_user: User = Depends(get_request_user),
+) -> StreamingResponse:
     """Get all chores for the current user."""
-    chores = await chore_repo.get_all_by_user(current_user.id)
-    return [ChoreRead.model_validate(chore) for chore in chores]
+    chore_repo = ChoreRepository()
+    return json_array_response(chore_repo.stream_all_by_user_rows(current_user.id))
 
 
 @router.get("/due", response_model=List[ChoreRead])
 async def get_due_chores(
     due_date: date | None = None,
-    current_user: User = Depends(get_current_user),
-    chore_repo: ChoreRepository = Depends(get_chore_repository),
-) -> List[ChoreRead]:
+    current_user: User = Depends(get_request_user),
+) -> StreamingResponse:
     """Get chores that are due on or before the specified date."""
-    chores = await chore_repo.get_due_chores(current_user.id, due_date)
-    return [ChoreRead.model_validate(chore) for chore in chores]
+    chore_repo = ChoreRepository()
+    return json_array_response(chore_repo.stream_due_rows(current_user.id, due_date))
 
 
 @router.get("/{chore_id}", response_model=ChoreRead)
+@cached_response(ChoreRead)
 async def get_chore(
     chore_id: int,
-    current_user: User = Depends(get_current_user),
-    chore_repo: ChoreRepository = Depends(get_chore_repository),
+    current_user: User = Depends(get_request_user),
 ) -> ChoreRead:
     """Get a specific chore by ID."""
+    chore_repo = ChoreRepository()
     chore = await chore_repo.get_by_id(chore_id, current_user.id)
     if not chore:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Chore not found"
         )
-    return ChoreRead.model_validate(chore)
+    return ChoreRead.from_orm_fast(chore)
 
 
 @router.put("/{chore_id}", response_model=ChoreRead)
 async def update_chore(
     chore_id: int,
     chore_data: ChoreUpdate,
-    current_user: User = Depends(get_current_user),
-    chore_repo: ChoreRepository = Depends(get_chore_repository),
+    current_user: User = Depends(get_request_user),
 ) -> ChoreRead:
     """Update a specific chore."""
-    chore = await chore_repo.get_by_id(chore_id, current_user.id)
-    if not chore:
+    chore_repo = ChoreRepository()
+    updated_chore = await chore_repo.update(chore_id, chore_data, current_user.id)
+    if not updated_chore:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Chore not found"
         )
-    
-    updated_chore = await chore_repo.update(chore, chore_data)
-    return ChoreRead.model_validate(updated_chore)
+    return ChoreRead.from_orm_fast(updated_chore)
 
 
 @router.delete("/{chore_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_chore(
     chore_id: int,
-    current_user: User = Depends(get_current_user),
-    chore_repo: ChoreRepository = Depends(get_chore_repository),
+    current_user: User = Depends(get_request_user),
 ) -> None:
     """Delete a specific chore."""
-    chore = await chore_repo.get_by_id(chore_id, current_user.id)
-    if not chore:
+    chore_repo = ChoreRepository()
+    deleted = await chore_repo.delete(chore_id, current_user.id)
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Chore not found"
         )
-    
-    await chore_repo.delete(chore)
 
 
 @router.post("/{chore_id}/complete", response_model=ChoreRead)
 async def complete_chore(
     chore_id: int,
     completion_data: ChoreComplete = ChoreComplete(),
-    current_user: User = Depends(get_current_user),
-    chore_repo: ChoreRepository = Depends(get_chore_repository),
+    current_user: User = Depends(get_request_user),
 ) -> ChoreRead:
     """Mark a chore as completed and update next due date."""
+    chore_repo = ChoreRepository()
     chore = await chore_repo.get_by_id(chore_id, current_user.id)
     if not chore:
         raise HTTPException(
@@ -127,4 +118,4 @@ async def complete_chore(
         )
     
     completed_chore = await chore_repo.complete_chore(chore, completion_data.completion_date)
-    return ChoreRead.model_validate(completed_chore)
\ No newline at end of file
+    return ChoreRead.from_orm_fast(completed_chore)
\ No newline at end of file
@@ -4,10 +4,10 @@ API endpoints for goal management.
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import get_current_active_user
-from app.core.database import get_session
+from app.core.auth import get_request_user
+from app.core.response_cache import cached_response
+from app.core.streaming import json_array_response
 from app.models.project import (
     Goal, GoalCreate, GoalRead, GoalUpdate
 )
@@ -16,63 +16,51 @@ from app.repositories.goal import GoalRepository
 
 router = APIRouter(prefix="/goals", tags=["goals"])
 
+# Goals nested under their project, mounted at /projects/{project_id}/goals
+project_router = APIRouter(prefix="/projects/{project_id}/goals", tags=["goals"])
 
-@router.post("/projects/{project_id}/goals", response_model=GoalRead, status_code=status.HTTP_201_CREATED)
+
+@project_router.post("", response_model=GoalRead, status_code=status.HTTP_201_CREATED)
 async def create_goal(
     project_id: int,
     goal_data: GoalCreate,
-    current_user: User = Depends(get_current_active_user),
-    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_request_user),
 ):
     """Create a new goal for a project."""
-    repository = GoalRepository(session)
-    
-    try:
-        goal = await repository.create(goal_data, project_id, current_user.id)
-        return goal
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
+    repository = GoalRepository()
+    goal = await repository.create(goal_data, project_id, current_user.id)
+    return GoalRead.from_orm_fast(goal)
 
 
-@router.get("/projects/{project_id}/goals", response_model=List[GoalRead])
+@project_router.get("", response_model=List[GoalRead])
+@cached_response(List[GoalRead])
 async def get_project_goals(
     project_id: int,
-    current_user: User = Depends(get_current_active_user),
-    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_request_user),
 ):
     """Get all goals for a project."""
-    repository = GoalRepository(session)
-    goals = await repository.get_all_for_project(project_id, current_user.id)
-    return goals
+    repository = GoalRepository()
+    return json_array_response(repository.stream_all_for_project(project_id, current_user.id))
 
 
 @router.get("/", response_model=List[GoalRead])
+@cached_response(List[GoalRead])
 async def get_goals(
-    current_user: User = Depends(get_current_active_user),
-    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_request_user),
 ):
     """Get all goals for the current user."""
-    repository = GoalRepository(session)
-    goals = await repository.get_all_for_user(current_user.id)
-    return goals
+    repository = GoalRepository()
+    # Rows already match GoalRead, so skip ORM and response-model round trips
+    return json_array_response(repository.stream_all_for_user_rows(current_user.id))
 
 
 @router.get("/{goal_id}", response_model=GoalRead)
 async def get_goal(
     goal_id: int,
-    current_user: User = Depends(get_current_active_user),
-    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_request_user),
 ):
     """Get a specific goal."""
-    repository = GoalRepository(session)
+    repository = GoalRepository()
     goal = await repository.get_by_id(goal_id, current_user.id)
     
     if not goal:
@@ -81,44 +69,35 @@ async def get_goal(
             detail="Goal not found"
         )
     
-    return goal
+    return GoalRead.from_orm_fast(goal)
 
 
 @router.put("/{goal_id}", response_model=GoalRead)
 async def update_goal(
     goal_id: int,
     goal_data: GoalUpdate,
-    current_user: User = Depends(get_current_active_user),
-    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_request_user),
 ):
     """Update a goal."""
-    repository = GoalRepository(session)
+    repository = GoalRepository()
+    goal = await repository.update(goal_id, goal_data, current_user.id)
     
-    try:
-        goal = await repository.update(goal_id, goal_data, current_user.id)
-        
-        if not goal:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Goal not found"
-            )
-        
-        return goal
-    except Exception as e:
+    if not goal:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Goal not found"
         )
+    
+    return GoalRead.from_orm_fast(goal)
 
 
 @router.delete("/{goal_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_goal(
     goal_id: int,
-    current_user: User = Depends(get_current_active_user),
-    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_request_user),
 ):
     """Delete a goal."""
-    repository = GoalRepository(session)
+    repository = GoalRepository()
     deleted = await repository.delete(goal_id, current_user.id)
     
     if not deleted:
@@ -129,13 +108,13 @@ async def delete_goal(
 
 
 @router.get("/{goal_id}/allocation", response_model=dict)
+@cached_response(dict)
 async def get_goal_allocation(
     goal_id: int,
-    current_user: User = Depends(get_current_active_user),
-    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_request_user),
 ):
     """Get time allocation summary for a goal."""
-    repository = GoalRepository(session)
+    repository = GoalRepository()
     allocation = await repository.get_allocation_summary(goal_id, current_user.id)
     
     if not allocation:
@@ -5,10 +5,10 @@ from datetime import date
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import StreamingResponse
 
-from app.core.auth import get_current_user
-from app.core.database import get_session
+from app.core.auth import get_request_user
+from app.core.streaming import json_array_response
 from app.models.recurring import (
     Habit,
     HabitComplete,
@@ -22,103 +22,92 @@ from app.repositories.habit import HabitRepository
 router = APIRouter(prefix="/habits", tags=["habits"])
 
 
-def get_habit_repository(session: AsyncSession = Depends(get_session)) -> HabitRepository:
-    """Dependency to get habit repository."""
-    return HabitRepository(session)
-
-
 @router.post("/", response_model=HabitRead, status_code=status.HTTP_201_CREATED)
 async def create_habit(
     habit_data: HabitCreate,
-    current_user: User = Depends(get_current_user),
-    habit_repo: HabitRepository = Depends(get_habit_repository),
+    current_user: User = Depends(get_request_user),
 ) -> HabitRead:
     """Create a new habit."""
+    habit_repo = HabitRepository()
     habit = await habit_repo.create(habit_data, current_user.id)
-    return HabitRead.model_validate(habit)
+    return HabitRead.from_orm_fast(habit)
 
 
 @router.get("/", response_model=List[HabitRead])
 async def get_habits(
-    current_user: User = Depends(get_current_user),
-    habit_repo: HabitRepository = Depends(get_habit_repository),
-) -> List[HabitRead]:
+    current_user: User = Depends(get_request_user),
+) -> StreamingResponse:
     """Get all habits for the current user."""
-    habits = await habit_repo.get_all_by_user(current_user.id)
-    return [HabitRead.model_validate(habit) for habit in habits]
+    habit_repo = HabitRepository()
+    return json_array_response(habit_repo.stream_all_by_user_rows(current_user.id))
 
 
 @router.get("/due", response_model=List[HabitRead])
 async def get_due_habits(
     due_date: date | None = None,
-    current_user: User = Depends(get_current_user),
-    habit_repo: HabitRepository = Depends(get_habit_repository),
-) -> List[HabitRead]:
+    current_user: User = Depends(get_request_user),
+) -> StreamingResponse:
     """Get habits that are due on or before the specified date."""
-    habits = await habit_repo.get_due_habits(current_user.id, due_date)
-    return [HabitRead.model_validate(habit) for habit in habits]
+    habit_repo = HabitRepository()
+    return json_array_response(habit_repo.stream_due_rows(current_user.id, due_date))
 
 
 @router.get("/{habit_id}", response_model=HabitRead)
 async def get_habit(
     habit_id: int,
-    current_user: User = Depends(get_current_user),
-    habit_repo: HabitRepository = Depends(get_habit_repository),
+    current_user: User = Depends(get_request_user),
 ) -> HabitRead:
     """Get a specific habit by ID."""
+    habit_repo = HabitRepository()
     habit = await habit_repo.get_by_id(habit_id, current_user.id)
     if not habit:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Habit not found"
         )
-    return HabitRead.model_validate(habit)
+    return HabitRead.from_orm_fast(habit)
 
 
 @router.put("/{habit_id}", response_model=HabitRead)
 async def update_habit(
     habit_id: int,
     habit_data: HabitUpdate,
-    current_user: User = Depends(get_current_user),
-    habit_repo: HabitRepository = Depends(get_habit_repository),
+    current_user: User = Depends(get_request_user),
 ) -> HabitRead:
     """Update a specific habit."""
-    habit = await habit_repo.get_by_id(habit_id, current_user.id)
-    if not habit:
+    habit_repo = HabitRepository()
+    updated_habit = await habit_repo.update(habit_id, habit_data, current_user.id)
+    if not updated_habit:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Habit not found"
         )
-    
-    updated_habit = await habit_repo.update(habit, habit_data)
-    return HabitRead.model_validate(updated_habit)
+    return HabitRead.from_orm_fast(updated_habit)
 
 
 @router.delete("/{habit_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_habit(
     habit_id: int,
-    current_user: User = Depends(get_current_user),
-    habit_repo: HabitRepository = Depends(get_habit_repository),
+    current_user: User = Depends(get_request_user),
 ) -> None:
     """Delete a specific habit."""
-    habit = await habit_repo.get_by_id(habit_id, current_user.id)
-    if not habit:
+    habit_repo = HabitRepository()
+    deleted = await habit_repo.delete(habit_id, current_user.id)
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Habit not found"
         )
-    
-    await habit_repo.delete(habit)
 
 
 @router.post("/{habit_id}/complete", response_model=HabitRead)
 async def complete_habit(
     habit_id: int,
     completion_data: HabitComplete = HabitComplete(),
-    current_user: User = Depends(get_current_user),
-    habit_repo: HabitRepository = Depends(get_habit_repository),
+    current_user: User = Depends(get_request_user),
 ) -> HabitRead:
     """Mark a habit as completed, update streak, and calculate next due date."""
+    habit_repo = HabitRepository()
     habit = await habit_repo.get_by_id(habit_id, current_user.id)
     if not habit:
         raise HTTPException(
@@ -127,4 +116,4 @@ async def complete_habit(
         )
     
     completed_habit = await habit_repo.complete_habit(habit, completion_data.completion_date)
-    return HabitRead.model_validate(completed_habit)
\ No newline at end of file
+    return HabitRead.from_orm_fast(completed_habit)
\ No newline at end of file
@@ -4,13 +4,11 @@ API endpoints for project management.
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import get_current_active_user
-from app.core.database import get_session
-from app.models.project import (
-    Project, ProjectCreate, ProjectRead, ProjectUpdate
-)
+from app.core.auth import get_request_user
+from app.core.response_cache import cached_response
+from app.core.streaming import json_array_response
+from app.models.project import Project, ProjectCreate, ProjectRead, ProjectUpdate
 from app.models.user import User
 from app.repositories.project import ProjectRepository
 from app.services.time_allocation import TimeAllocationService
@@ -22,71 +20,62 @@ router = APIRouter(prefix="/projects", tags=["projects"])
 @router.post("/", response_model=ProjectRead, status_code=status.HTTP_201_CREATED)
 async def create_project(
     project_data: ProjectCreate,
-    current_user: User = Depends(get_current_active_user),
-    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_request_user),
 ):
     """Create a new project."""
-    repository = ProjectRepository(session)
-    
-    repository = ProjectRepository(session)
+    repository = ProjectRepository()
     project = await repository.create(project_data, current_user.id)
-    return project
+    return ProjectRead.from_orm_fast(project)
 
 
 @router.get("/", response_model=List[ProjectRead])
 async def get_projects(
-    current_user: User = Depends(get_current_active_user),
-    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_request_user),
 ):
     """Get all projects for the current user."""
-    repository = ProjectRepository(session)
-    projects = await repository.get_all_for_user(current_user.id)
-    return projects
+    repository = ProjectRepository()
+    # Rows already match ProjectRead, so skip ORM and response-model round trips
+    return json_array_response(repository.stream_all_for_user_rows(current_user.id))
 
 
 @router.get("/{project_id}", response_model=ProjectRead)
 async def get_project(
     project_id: int,
-    current_user: User = Depends(get_current_active_user),
-    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_request_user),
 ):
     """Get a specific project."""
-    repository = ProjectRepository(session)
+    repository = ProjectRepository()
     project = await repository.get_by_id(project_id, current_user.id)
     
     if not project:
         raise ResourceNotFound("Project", project_id)
     
-    return project
+    return ProjectRead.from_orm_fast(project)
 
 
 @router.put("/{project_id}", response_model=ProjectRead)
 async def update_project(
     project_id: int,
     project_data: ProjectUpdate,
-    current_user: User = Depends(get_current_active_user),
-    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_request_user),
 ):
     """Update a project."""
-    repository = ProjectRepository(session)
-    
-    repository = ProjectRepository(session)
+    repository = ProjectRepository()
     project = await repository.update(project_id, project_data, current_user.id)
     
     if not project:
         raise ResourceNotFound("Project", project_id)
     
-    return project
+    return ProjectRead.from_orm_fast(project)
 
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_project(
     project_id: int,
-    current_user: User = Depends(get_current_active_user),
-    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_request_user),
 ):
     """Delete a project."""
-    repository = ProjectRepository(session)
+    repository = ProjectRepository()
     deleted = await repository.delete(project_id, current_user.id)
     
     if not deleted:
@@ -97,13 +86,13 @@ async def delete_project(
 
 
 @router.get("/{project_id}/allocation", response_model=dict)
+@cached_response(dict)
 async def get_project_allocation(
     project_id: int,
-    current_user: User = Depends(get_current_active_user),
-    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_request_user),
 ):
     """Get time allocation summary for a project."""
-    repository = ProjectRepository(session)
+    repository = ProjectRepository()
     allocation = await repository.get_allocation_summary(project_id, current_user.id)
     
     if not allocation:
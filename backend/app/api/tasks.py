@@ -4,81 +4,63 @@ API endpoints for task management.
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import get_current_active_user
-from app.core.database import get_session
+from app.core.auth import get_request_user
+from app.core.response_cache import cached_response
+from app.core.streaming import json_array_response
 from app.models.project import (
     Task, TaskCreate, TaskRead, TaskUpdate
 )
 from app.models.user import User
 from app.repositories.task import TaskRepository
-from app.core.exceptions import TimeAllocationExceeded
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
+# Tasks nested under their goal, mounted at /goals/{goal_id}/tasks
+goal_router = APIRouter(prefix="/goals/{goal_id}/tasks", tags=["tasks"])
 
-@router.post("/goals/{goal_id}/tasks", response_model=TaskRead, status_code=status.HTTP_201_CREATED)
+
+@goal_router.post("", response_model=TaskRead, status_code=status.HTTP_201_CREATED)
 async def create_task(
     goal_id: int,
     task_data: TaskCreate,
-    current_user: User = Depends(get_current_active_user),
-    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_request_user),
 ):
     """Create a new task for a goal."""
-    repository = TaskRepository(session)
-    
-    try:
-        task = await repository.create(task_data, goal_id, current_user.id)
-        return task
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except TimeAllocationExceeded as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
+    repository = TaskRepository()
+    task = await repository.create(task_data, goal_id, current_user.id)
+    return TaskRead.from_orm_fast(task)
 
 
-@router.get("/goals/{goal_id}/tasks", response_model=List[TaskRead])
+@goal_router.get("", response_model=List[TaskRead])
+@cached_response(List[TaskRead])
 async def get_goal_tasks(
     goal_id: int,
-    current_user: User = Depends(get_current_active_user),
-    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_request_user),
 ):
     """Get all tasks for a goal."""
-    repository = TaskRepository(session)
-    tasks = await repository.get_all_for_goal(goal_id, current_user.id)
-    return tasks
+    repository = TaskRepository()
+    return json_array_response(repository.stream_all_for_goal(goal_id, current_user.id))
 
 
 @router.get("/", response_model=List[TaskRead])
+@cached_response(List[TaskRead])
 async def get_tasks(
-    current_user: User = Depends(get_current_active_user),
-    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_request_user),
 ):
     """Get all tasks for the current user."""
-    repository = TaskRepository(session)
-    tasks = await repository.get_all_for_user(current_user.id)
-    return tasks
+    repository = TaskRepository()
+    # Rows already match TaskRead, so skip ORM and response-model round trips
+    return json_array_response(repository.stream_all_for_user_rows(current_user.id))
 
 
 @router.get("/{task_id}", response_model=TaskRead)
 async def get_task(
     task_id: int,
-    current_user: User = Depends(get_current_active_user),
-    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_request_user),
 ):
     """Get a specific task."""
-    repository = TaskRepository(session)
+    repository = TaskRepository()
     task = await repository.get_by_id(task_id, current_user.id)
     
     if not task:
@@ -87,49 +69,35 @@ async def get_task(
             detail="Task not found"
         )
     
-    return task
+    return TaskRead.from_orm_fast(task)
 
 
 @router.put("/{task_id}", response_model=TaskRead)
 async def update_task(
     task_id: int,
     task_data: TaskUpdate,
-    current_user: User = Depends(get_current_active_user),
-    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_request_user),
 ):
     """Update a task."""
-    repository = TaskRepository(session)
+    repository = TaskRepository()
+    task = await repository.update(task_id, task_data, current_user.id)
     
-    try:
-        task = await repository.update(task_id, task_data, current_user.id)
-        
-        if not task:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Task not found"
-            )
-        
-        return task
-    except TimeAllocationExceeded as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
+    if not task:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found"
         )
+    
+    return TaskRead.from_orm_fast(task)
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_task(
     task_id: int,
-    current_user: User = Depends(get_current_active_user),
-    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_request_user),
 ):
     """Delete a task."""
-    repository = TaskRepository(session)
+    repository = TaskRepository()
     deleted = await repository.delete(task_id, current_user.id)
     
     if not deleted:
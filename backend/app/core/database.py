@@ -1,7 +1,11 @@
 """
 Database configuration and connection management.
 """
+import asyncio
+from contextvars import ContextVar
 from typing import AsyncGenerator
+
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
 
@@ -13,24 +17,64 @@ database_url = settings.DATABASE_URL
 if database_url.startswith("postgresql://"):
     database_url = database_url.replace("postgresql://", "postgresql+asyncpg://")
 
+# asyncpg-specific connection tuning: skip the JIT planner for short OLTP
+# queries and keep more prepared statements per connection
+connect_args = {}
+if database_url.startswith("postgresql+asyncpg://"):
+    connect_args = {
+        "server_settings": {"jit": "off"},
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    }
+
 engine = create_async_engine(
     database_url,
     echo=settings.DEBUG,
     future=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    connect_args=connect_args,
 )
 
-# Create async session factory
+# Create async session factory. Objects keep their loaded state across
+# commit, and the INSERT already returns the generated primary key, so
+# repositories don't refresh() after writing. Repositories never query
+# between adding changes and committing them, so autoflush would only add
+# a pending-state check to every query.
 AsyncSessionLocal = async_sessionmaker(
-    engine, class_=AsyncSession, expire_on_commit=False
+    engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
 )
 
 
+# Session opened by AuthSessionMiddleware for the request being handled
+request_session: ContextVar[AsyncSession] = ContextVar("request_session")
+
+
 async def init_db() -> None:
     """Initialize database tables."""
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
 
 
+async def warm_pool() -> None:
+    """
+    Open a few pool connections up front, concurrently.
+    
+    Only DB_POOL_WARM_SIZE connections are opened, so starting every worker
+    at once doesn't claim its whole pool from the server; the rest are
+    opened on demand.
+    """
+    async def checkout() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    
+    warm_size = min(settings.DB_POOL_WARM_SIZE, settings.DB_POOL_SIZE)
+    await asyncio.gather(*(checkout() for _ in range(warm_size)))
+
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency to get database session.
@@ -48,6 +92,19 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+def get_request_session() -> AsyncSession:
+    """
+    Get the database session scoped to the current request.
+    
+    Returns:
+        AsyncSession: Session opened by AuthSessionMiddleware
+        
+    Raises:
+        LookupError: If called outside of a request handled by the middleware
+    """
+    return request_session.get()
+
+
 async def close_db() -> None:
     """Close database connections."""
     await engine.dispose()
\ No newline at end of file
@@ -2,13 +2,55 @@
 Database initialization and utility functions.
 """
 import asyncio
-from typing import Optional
+import re
+from typing import Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
 
+import asyncpg
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlmodel import SQLModel
 
 from app.core.config import settings
 
+# Database names accepted by the create/drop helpers; anything else would
+# need quoting rules we don't want to get wrong in DDL
+_IDENTIFIER_RE = re.compile(r"^[A-Za-z0-9_]+$")
+
+
+def _ident(name: str) -> str:
+    """
+    Validate and quote a database name for use in DDL.
+    
+    Args:
+        name: Database name
+        
+    Returns:
+        The double-quoted identifier
+        
+    Raises:
+        ValueError: If the name contains characters other than [A-Za-z0-9_]
+    """
+    if not _IDENTIFIER_RE.match(name):
+        raise ValueError(f"Invalid database name: {name!r}")
+    return f'"{name}"'
+
+
+def _split_database_url(database_url: str) -> Tuple[str, str]:
+    """
+    Split a database URL into a maintenance-database DSN and the target name.
+    
+    Args:
+        database_url: Database URL
+        
+    Returns:
+        Tuple of (DSN pointing at the "postgres" database, target database name)
+    """
+    parts = urlsplit(database_url)
+    db_name = parts.path.lstrip("/")
+    scheme = parts.scheme.split("+", 1)[0]
+    postgres_dsn = urlunsplit(parts._replace(scheme=scheme, path="/postgres"))
+    return postgres_dsn, db_name
+
 
 async def create_database_if_not_exists(database_url: str) -> None:
     """
@@ -17,32 +59,23 @@ async def create_database_if_not_exists(database_url: str) -> None:
     Args:
         database_url: Database URL
     """
-    # Extract database name from URL
-    db_name = database_url.split("/")[-1]
-    
-    # Create connection to postgres database to create our target database
-    postgres_url = database_url.rsplit("/", 1)[0] + "/postgres"
-    
-    engine = create_async_engine(
-        postgres_url.replace("postgresql://", "postgresql+asyncpg://"),
-        isolation_level="AUTOCOMMIT"
-    )
+    postgres_dsn, db_name = _split_database_url(database_url)
+    quoted_name = _ident(db_name)
     
+    # Connect to the postgres database to create our target database
+    conn = await asyncpg.connect(postgres_dsn)
     try:
-        async with engine.connect() as conn:
-            # Check if database exists
-            result = await conn.execute(
-                f"SELECT 1 FROM pg_database WHERE datname = '{db_name}'"
-            )
-            exists = result.fetchone()
-            
-            if not exists:
-                await conn.execute(f"CREATE DATABASE {db_name}")
-                print(f"Database '{db_name}' created successfully")
-            else:
-                print(f"Database '{db_name}' already exists")
+        exists = await conn.fetchval(
+            "SELECT 1 FROM pg_database WHERE datname = $1", db_name
+        )
+        
+        if not exists:
+            await conn.execute(f"CREATE DATABASE {quoted_name}")
+            print(f"Database '{db_name}' created successfully")
+        else:
+            print(f"Database '{db_name}' already exists")
     finally:
-        await engine.dispose()
+        await conn.close()
 
 
 async def drop_database_if_exists(database_url: str) -> None:
@@ -52,33 +85,27 @@ async def drop_database_if_exists(database_url: str) -> None:
     Args:
         database_url: Database URL
     """
-    # Extract database name from URL
-    db_name = database_url.split("/")[-1]
-    
-    # Create connection to postgres database to drop our target database
-    postgres_url = database_url.rsplit("/", 1)[0] + "/postgres"
-    
-    engine = create_async_engine(
-        postgres_url.replace("postgresql://", "postgresql+asyncpg://"),
-        isolation_level="AUTOCOMMIT"
-    )
+    postgres_dsn, db_name = _split_database_url(database_url)
+    quoted_name = _ident(db_name)
     
+    # Connect to the postgres database to drop our target database
+    conn = await asyncpg.connect(postgres_dsn)
     try:
-        async with engine.connect() as conn:
-            # Terminate existing connections to the database
-            await conn.execute(
-                f"""
-                SELECT pg_terminate_backend(pid)
-                FROM pg_stat_activity
-                WHERE datname = '{db_name}' AND pid <> pg_backend_pid()
-                """
-            )
-            
-            # Drop database if exists
-            await conn.execute(f"DROP DATABASE IF EXISTS {db_name}")
-            print(f"Database '{db_name}' dropped successfully")
+        # Terminate existing connections to the database
+        await conn.execute(
+            """
+            SELECT pg_terminate_backend(pid)
+            FROM pg_stat_activity
+            WHERE datname = $1 AND pid <> pg_backend_pid()
+            """,
+            db_name,
+        )
+        
+        # Drop database if exists
+        await conn.execute(f"DROP DATABASE IF EXISTS {quoted_name}")
+        print(f"Database '{db_name}' dropped successfully")
     finally:
-        await engine.dispose()
+        await conn.close()
 
 
 async def init_database(engine: Optional[AsyncEngine] = None) -> None:
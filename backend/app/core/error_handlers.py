@@ -2,10 +2,11 @@
 Global exception handlers for FastAPI application.
 """
 import logging
+import re
 from typing import Union
 
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from pydantic import ValidationError
@@ -23,13 +24,50 @@ from app.core.exceptions import (
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# HTTP status and error code per exception class, resolved once at import
+_STATUS_BY_CLASS = {
+    TimeAllocationExceeded: status.HTTP_422_UNPROCESSABLE_ENTITY,
+    ResourceNotFound: status.HTTP_404_NOT_FOUND,
+    UnauthorizedAccess: status.HTTP_403_FORBIDDEN,
+    CustomValidationError: status.HTTP_422_UNPROCESSABLE_ENTITY,
+    BusinessLogicError: status.HTTP_422_UNPROCESSABLE_ENTITY,
+    DatabaseError: status.HTTP_500_INTERNAL_SERVER_ERROR,
+}
+
+_ERROR_CODE_BY_CLASS = {cls: cls.__name__.upper() for cls in _STATUS_BY_CLASS}
+
+# Integrity error classification: one case-insensitive scan of the driver
+# message, keyed by the matched constraint kind
+_CONSTRAINT_KIND = re.compile(
+    r"(unique|foreign key|not[- ]null) constraint", re.IGNORECASE
+)
+
+_CONSTRAINT_MESSAGES = {
+    "unique": "Duplicate entry - this value already exists",
+    "foreign key": "Referenced resource does not exist",
+    "not null": "Required field cannot be empty",
+    "not-null": "Required field cannot be empty",
+}
+
+
+class _LazyURL:
+    """Defers str(request.url) until a log handler actually formats the record."""
+    
+    __slots__ = ("request",)
+    
+    def __init__(self, request: Request):
+        self.request = request
+    
+    def __str__(self) -> str:
+        return str(self.request.url)
+
 
 def create_error_response(
     status_code: int,
     error_code: str,
     message: str,
     details: dict = None
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Create a standardized error response."""
     error_response = {
         "error": {
@@ -41,7 +79,7 @@ def create_error_response(
     if details:
         error_response["error"]["details"] = details
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content=error_response
     )
@@ -50,28 +88,17 @@ def create_error_response(
 async def productivity_system_exception_handler(
     request: Request, 
     exc: ProductivitySystemException
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle custom productivity system exceptions."""
-    error_code = exc.__class__.__name__.upper()
-    
-    # Map exception types to HTTP status codes
-    status_code_map = {
-        "TimeAllocationExceeded": status.HTTP_422_UNPROCESSABLE_ENTITY,
-        "ResourceNotFound": status.HTTP_404_NOT_FOUND,
-        "UnauthorizedAccess": status.HTTP_403_FORBIDDEN,
-        "ValidationError": status.HTTP_422_UNPROCESSABLE_ENTITY,
-        "BusinessLogicError": status.HTTP_422_UNPROCESSABLE_ENTITY,
-        "DatabaseError": status.HTTP_500_INTERNAL_SERVER_ERROR,
-    }
-    
-    status_code = status_code_map.get(
-        exc.__class__.__name__, 
-        status.HTTP_500_INTERNAL_SERVER_ERROR
-    )
+    exc_class = type(exc)
+    error_code = _ERROR_CODE_BY_CLASS.get(exc_class) or exc_class.__name__.upper()
+    status_code = _STATUS_BY_CLASS.get(exc_class, status.HTTP_500_INTERNAL_SERVER_ERROR)
     
     logger.warning(
-        f"ProductivitySystemException: {exc.__class__.__name__} - {exc.message}",
-        extra={"details": exc.details, "request_url": str(request.url)}
+        "ProductivitySystemException: %s - %s",
+        exc_class.__name__,
+        exc.message,
+        extra={"details": exc.details, "request_url": _LazyURL(request)}
     )
     
     return create_error_response(
@@ -85,11 +112,12 @@ async def productivity_system_exception_handler(
 async def time_allocation_exceeded_handler(
     request: Request, 
     exc: TimeAllocationExceeded
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle time allocation exceeded exceptions."""
     logger.warning(
-        f"Time allocation exceeded: {exc.message}",
-        extra={"details": exc.details, "request_url": str(request.url)}
+        "Time allocation exceeded: %s",
+        exc.message,
+        extra={"details": exc.details, "request_url": _LazyURL(request)}
     )
     
     return create_error_response(
@@ -103,11 +131,12 @@ async def time_allocation_exceeded_handler(
 async def resource_not_found_handler(
     request: Request, 
     exc: ResourceNotFound
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle resource not found exceptions."""
     logger.info(
-        f"Resource not found: {exc.message}",
-        extra={"details": exc.details, "request_url": str(request.url)}
+        "Resource not found: %s",
+        exc.message,
+        extra={"details": exc.details, "request_url": _LazyURL(request)}
     )
     
     return create_error_response(
@@ -121,11 +150,12 @@ async def resource_not_found_handler(
 async def unauthorized_access_handler(
     request: Request, 
     exc: UnauthorizedAccess
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle unauthorized access exceptions."""
     logger.warning(
-        f"Unauthorized access attempt: {exc.message}",
-        extra={"details": exc.details, "request_url": str(request.url)}
+        "Unauthorized access attempt: %s",
+        exc.message,
+        extra={"details": exc.details, "request_url": _LazyURL(request)}
     )
     
     return create_error_response(
@@ -139,7 +169,7 @@ async def unauthorized_access_handler(
 async def validation_error_handler(
     request: Request, 
     exc: Union[RequestValidationError, ValidationError, CustomValidationError]
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle validation errors."""
     if isinstance(exc, CustomValidationError):
         return create_error_response(
@@ -150,18 +180,21 @@ async def validation_error_handler(
         )
     
     # Handle Pydantic validation errors
-    error_details = []
-    for error in exc.errors():
-        error_details.append({
-            "field": " -> ".join(str(loc) for loc in error["loc"]),
+    error_details = [
+        {
+            "field": " -> ".join(map(str, error["loc"])),
             "message": error["msg"],
             "type": error["type"]
-        })
+        }
+        for error in exc.errors()
+    ]
     
-    logger.info(
-        f"Validation error: {len(error_details)} field(s) failed validation",
-        extra={"errors": error_details, "request_url": str(request.url)}
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Validation error: %d field(s) failed validation",
+            len(error_details),
+            extra={"errors": error_details, "request_url": _LazyURL(request)}
+        )
     
     return create_error_response(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -174,12 +207,13 @@ async def validation_error_handler(
 async def database_error_handler(
     request: Request, 
     exc: Union[SQLAlchemyError, DatabaseError]
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle database errors."""
     if isinstance(exc, DatabaseError):
         logger.error(
-            f"Database error: {exc.message}",
-            extra={"details": exc.details, "request_url": str(request.url)}
+            "Database error: %s",
+            exc.message,
+            extra={"details": exc.details, "request_url": _LazyURL(request)}
         )
         
         return create_error_response(
@@ -192,19 +226,31 @@ async def database_error_handler(
     # Handle SQLAlchemy integrity errors (unique constraints, foreign keys, etc.)
     if isinstance(exc, IntegrityError):
         error_message = "Database constraint violation"
-        details = {"constraint_error": str(exc.orig)}
+        orig_message = str(exc.orig)
+        details = {"constraint_error": orig_message}
+        
+        # The weekly hours triggers report over-allocation as a check violation
+        if getattr(exc.orig, "sqlstate", None) == "23514":
+            logger.info(
+                "Time allocation exceeded at commit",
+                extra={"details": details, "request_url": _LazyURL(request)}
+            )
+            return create_error_response(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                error_code="TIME_ALLOCATION_EXCEEDED",
+                message="Weekly hours exceed the available allocation",
+                details=details
+            )
         
         # Check for common constraint violations
-        if "unique constraint" in str(exc.orig).lower():
-            error_message = "Duplicate entry - this value already exists"
-        elif "foreign key constraint" in str(exc.orig).lower():
-            error_message = "Referenced resource does not exist"
-        elif "not null constraint" in str(exc.orig).lower():
-            error_message = "Required field cannot be empty"
+        match = _CONSTRAINT_KIND.search(orig_message)
+        if match:
+            error_message = _CONSTRAINT_MESSAGES[match.group(1).lower()]
         
         logger.warning(
-            f"Database integrity error: {error_message}",
-            extra={"details": details, "request_url": str(request.url)}
+            "Database integrity error: %s",
+            error_message,
+            extra={"details": details, "request_url": _LazyURL(request)}
         )
         
         return create_error_response(
@@ -216,8 +262,9 @@ async def database_error_handler(
     
     # Handle other SQLAlchemy errors
     logger.error(
-        f"Database error: {str(exc)}",
-        extra={"error_type": type(exc).__name__, "request_url": str(request.url)}
+        "Database error: %s",
+        exc,
+        extra={"error_type": type(exc).__name__, "request_url": _LazyURL(request)}
     )
     
     return create_error_response(
@@ -227,13 +274,14 @@ async def database_error_handler(
     )
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle unexpected exceptions."""
     logger.error(
-        f"Unexpected error: {str(exc)}",
+        "Unexpected error: %s",
+        exc,
         extra={
             "error_type": type(exc).__name__, 
-            "request_url": str(request.url)
+            "request_url": _LazyURL(request)
         },
         exc_info=True
     )
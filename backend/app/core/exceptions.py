@@ -1,21 +1,74 @@
 """
 Custom exception classes for the productivity management system.
 """
-from typing import Any, Dict, Optional
+import reprlib
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, Mapping, Optional
+
+# Shared read-only details for exceptions raised without any
+_EMPTY_DETAILS: Mapping[str, Any] = MappingProxyType({})
+
+# Longest offending value echoed back in validation error details
+MAX_REFLECTED_VALUE_LENGTH = 256
+
+_value_repr = reprlib.Repr()
+_value_repr.maxstring = _value_repr.maxother = MAX_REFLECTED_VALUE_LENGTH
+
+
+def _bounded_value(value: Any) -> Any:
+    """
+    Bound the size of a value echoed back in error details.
+    
+    JSON scalars pass through unchanged, long strings are cut to
+    MAX_REFLECTED_VALUE_LENGTH characters and anything else is replaced by a
+    size-limited repr, so large request bodies aren't serialized back.
+    
+    Args:
+        value: Offending input value
+        
+    Returns:
+        A JSON-safe value of bounded size
+    """
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        if len(value) <= MAX_REFLECTED_VALUE_LENGTH:
+            return value
+        return value[:MAX_REFLECTED_VALUE_LENGTH] + "…"
+    return _value_repr.repr(value)
 
 
 class ProductivitySystemException(Exception):
     """Base exception for the productivity system."""
     
-    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
+    # Slots give message/details fixed-offset storage; BaseException
+    # instances still carry their own __dict__ regardless
+    __slots__ = ("_message", "details")
+    
+    # Template formatted from details when no explicit message was given
+    default_message: ClassVar[str] = "Productivity system error"
+    
+    def __init__(self, message: Optional[str], details: Optional[Dict[str, Any]] = None):
         super().__init__(message)
-        self.message = message
-        self.details = details or {}
+        self._message = message
+        self.details: Mapping[str, Any] = details if details else _EMPTY_DETAILS
+    
+    @property
+    def message(self) -> str:
+        """The error message, formatted from the default template on first access."""
+        if self._message is None:
+            self._message = self.default_message.format_map(self.details)
+        return self._message
+    
+    def __str__(self) -> str:
+        return self.message
 
 
 class TimeAllocationExceeded(ProductivitySystemException):
     """Raised when time allocation constraints are violated."""
     
+    __slots__ = ()
+    
     def __init__(
         self, 
         message: str, 
@@ -26,7 +79,7 @@ class TimeAllocationExceeded(ProductivitySystemException):
         available_hours: Optional[float] = None,
         details: Optional[Dict[str, Any]] = None
     ):
-        error_details = details or {}
+        error_details = dict(details) if details else {}
         if project_id is not None:
             error_details["project_id"] = project_id
         if goal_id is not None:
@@ -44,6 +97,9 @@ class TimeAllocationExceeded(ProductivitySystemException):
 class ResourceNotFound(ProductivitySystemException):
     """Raised when requested resource doesn't exist."""
     
+    __slots__ = ()
+    default_message = "{resource_type} with ID {resource_id} not found"
+    
     def __init__(
         self, 
         resource_type: str, 
@@ -51,14 +107,12 @@ class ResourceNotFound(ProductivitySystemException):
         message: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None
     ):
-        if message is None:
-            message = f"{resource_type} with ID {resource_id} not found"
-        
-        error_details = details or {}
-        error_details.update({
+        error_details = {
             "resource_type": resource_type,
             "resource_id": resource_id
-        })
+        }
+        if details:
+            error_details = {**details, **error_details}
         
         super().__init__(message, error_details)
 
@@ -66,6 +120,9 @@ class ResourceNotFound(ProductivitySystemException):
 class UnauthorizedAccess(ProductivitySystemException):
     """Raised when user tries to access resources they don't own."""
     
+    __slots__ = ()
+    default_message = "User {user_id} is not authorized to access {resource_type} {resource_id}"
+    
     def __init__(
         self, 
         user_id: int, 
@@ -74,15 +131,13 @@ class UnauthorizedAccess(ProductivitySystemException):
         message: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None
     ):
-        if message is None:
-            message = f"User {user_id} is not authorized to access {resource_type} {resource_id}"
-        
-        error_details = details or {}
-        error_details.update({
+        error_details = {
             "user_id": user_id,
             "resource_type": resource_type,
             "resource_id": resource_id
-        })
+        }
+        if details:
+            error_details = {**details, **error_details}
         
         super().__init__(message, error_details)
 
@@ -90,6 +145,9 @@ class UnauthorizedAccess(ProductivitySystemException):
 class ValidationError(ProductivitySystemException):
     """Raised when input validation fails."""
     
+    __slots__ = ()
+    default_message = "Validation failed for field '{field}': {constraint}"
+    
     def __init__(
         self, 
         field: str, 
@@ -98,15 +156,13 @@ class ValidationError(ProductivitySystemException):
         message: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None
     ):
-        if message is None:
-            message = f"Validation failed for field '{field}': {constraint}"
-        
-        error_details = details or {}
-        error_details.update({
+        error_details = {
             "field": field,
-            "value": value,
+            "value": _bounded_value(value),
             "constraint": constraint
-        })
+        }
+        if details:
+            error_details = {**details, **error_details}
         
         super().__init__(message, error_details)
 
@@ -114,6 +170,9 @@ class ValidationError(ProductivitySystemException):
 class BusinessLogicError(ProductivitySystemException):
     """Raised when business logic constraints are violated."""
     
+    __slots__ = ()
+    default_message = "Business logic error in {operation}: {constraint}"
+    
     def __init__(
         self,
         operation: str,
@@ -121,14 +180,12 @@ class BusinessLogicError(ProductivitySystemException):
         message: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None
     ):
-        if message is None:
-            message = f"Business logic error in {operation}: {constraint}"
-        
-        error_details = details or {}
-        error_details.update({
+        error_details = {
             "operation": operation,
             "constraint": constraint
-        })
+        }
+        if details:
+            error_details = {**details, **error_details}
         
         super().__init__(message, error_details)
 
@@ -136,6 +193,9 @@ class BusinessLogicError(ProductivitySystemException):
 class DatabaseError(ProductivitySystemException):
     """Raised when database operations fail."""
     
+    __slots__ = ()
+    default_message = "Database error during {operation}"
+    
     def __init__(
         self,
         operation: str,
@@ -143,13 +203,9 @@ class DatabaseError(ProductivitySystemException):
         original_error: Optional[Exception] = None,
         details: Optional[Dict[str, Any]] = None
     ):
-        if message is None:
-            message = f"Database error during {operation}"
-        
-        error_details = details or {}
-        error_details.update({
-            "operation": operation
-        })
+        error_details = {"operation": operation}
+        if details:
+            error_details = {**details, **error_details}
         if original_error:
             error_details["original_error"] = str(original_error)
             error_details["error_type"] = type(original_error).__name__
@@ -0,0 +1,102 @@
+"""
+ASGI middleware for per-request authentication and database sessions.
+"""
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.auth import ACTIVE_USER_BY_ID
+from app.core.cache import TTLCache
+from app.core.database import AsyncSessionLocal, request_session
+from app.core.security import verify_token
+from app.models.user import User
+
+# Detached snapshots of recently authenticated users, keyed by user ID.
+# Call user_cache.pop(user_id) after changing a user's row.
+user_cache: TTLCache[int, User] = TTLCache(maxsize=10_000, ttl=30)
+
+
+def get_bearer_token(scope: Scope) -> Optional[str]:
+    """
+    Extract the bearer token from the raw ASGI headers.
+
+    Args:
+        scope: ASGI connection scope
+
+    Returns:
+        The token string if a Bearer Authorization header is present, None otherwise
+    """
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            scheme, _, token = value.partition(b" ")
+            if scheme.lower() != b"bearer" or not token:
+                return None
+            return token.strip().decode("latin-1")
+    return None
+
+
+async def load_user(session: AsyncSession, token: Optional[str]) -> Optional[User]:
+    """
+    Resolve the user referenced by a JWT token.
+
+    Users are served from a short-lived in-process cache when possible and
+    otherwise fetched by primary key. Inactive users resolve to None.
+
+    Args:
+        session: Database session
+        token: Raw JWT token, if any
+
+    Returns:
+        The User object if the token is valid and the user exists and is active,
+        None otherwise
+    """
+    if token is None:
+        return None
+
+    subject = verify_token(token)
+    if subject is None:
+        return None
+
+    try:
+        user_id = int(subject)
+    except ValueError:
+        return None
+
+    user = user_cache.get(user_id)
+    if user is None:
+        db_user = await session.scalar(ACTIVE_USER_BY_ID, {"uid": user_id})
+        if db_user is None:
+            return None
+        user = User.model_validate(db_user)
+        user_cache.set(user_id, user)
+
+    return user
+
+
+class AuthSessionMiddleware:
+    """
+    Pure ASGI middleware that opens one database session per HTTP request and
+    authenticates the bearer token against it.
+
+    The session is bound to the ``request_session`` context variable for the
+    lifetime of the request and the resolved user (or None) is stored on
+    ``scope["state"]``, so neither goes through the dependency solver.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async with AsyncSessionLocal() as session:
+            token = request_session.set(session)
+            try:
+                state = scope.setdefault("state", {})
+                state["user"] = await load_user(session, get_bearer_token(scope))
+                await self.app(scope, receive, send)
+            finally:
+                request_session.reset(token)
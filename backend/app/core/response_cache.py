@@ -0,0 +1,196 @@
+"""
+Per-user response caching backed by Redis.
+
+Caching is enabled only when REDIS_URL is configured and the optional
+``redis`` package is installed; otherwise every call falls through to the
+endpoint. Each user's cached responses live in a single Redis hash so a write
+by that user can drop all of them with one DEL.
+"""
+import functools
+import logging
+from typing import Any, Awaitable, Callable, Optional
+
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+try:
+    import redis.asyncio as redis
+    from redis.exceptions import RedisError
+except ImportError:  # pragma: no cover - redis is an optional dependency
+    redis = None
+    RedisError = OSError
+
+logger = logging.getLogger(__name__)
+
+# Methods that never modify data and therefore never invalidate the cache
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class ResponseCache:
+    """Stores serialized JSON responses per user in Redis hashes."""
+
+    def __init__(self, ttl: int = 30):
+        self.ttl = ttl
+        self._client = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a Redis connection is configured."""
+        return self._client is not None
+
+    async def connect(self, url: str) -> None:
+        """
+        Connect to Redis.
+
+        Args:
+            url: Redis connection URL
+
+        Raises:
+            RuntimeError: If the redis package is not installed
+        """
+        if redis is None:
+            raise RuntimeError("REDIS_URL is set but the 'redis' package is not installed")
+        self._client = redis.from_url(url)
+
+    async def close(self) -> None:
+        """Close the Redis connection, if any."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @staticmethod
+    def _namespace(user_id: int) -> str:
+        return f"cache:user:{user_id}"
+
+    async def get(self, user_id: int, key: str) -> Optional[bytes]:
+        """
+        Get a cached response body.
+
+        Args:
+            user_id: Owner of the cached response
+            key: Cache key within the user's namespace
+
+        Returns:
+            The cached body, or None on a miss or Redis error
+        """
+        try:
+            return await self._client.hget(self._namespace(user_id), key)
+        except RedisError:
+            logger.warning("Response cache read failed", exc_info=True)
+            return None
+
+    async def set(self, user_id: int, key: str, body: bytes) -> None:
+        """
+        Store a response body and refresh the namespace TTL.
+
+        Args:
+            user_id: Owner of the cached response
+            key: Cache key within the user's namespace
+            body: Serialized response body
+        """
+        namespace = self._namespace(user_id)
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                pipe.hset(namespace, key, body)
+                pipe.expire(namespace, self.ttl)
+                await pipe.execute()
+        except RedisError:
+            logger.warning("Response cache write failed", exc_info=True)
+
+    async def invalidate(self, user_id: int) -> None:
+        """
+        Drop every cached response for a user.
+
+        Args:
+            user_id: User whose cached responses should be dropped
+        """
+        try:
+            await self._client.delete(self._namespace(user_id))
+        except RedisError:
+            logger.warning("Response cache invalidation failed", exc_info=True)
+
+
+response_cache = ResponseCache(ttl=settings.RESPONSE_CACHE_TTL)
+
+
+def cached_response(response_type: Any) -> Callable:
+    """
+    Cache a GET endpoint's JSON body per user.
+
+    The endpoint must take ``current_user``; the cache key is built from the
+    endpoint name and its remaining keyword arguments.
+
+    Args:
+        response_type: The endpoint's response model, used to serialize results
+    """
+    adapter = TypeAdapter(response_type)
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        prefix = f"{func.__module__}.{func.__name__}"
+
+        @functools.wraps(func)
+        async def wrapper(**kwargs: Any) -> Any:
+            if not response_cache.enabled:
+                return await func(**kwargs)
+
+            user_id = kwargs["current_user"].id
+            key = ":".join(
+                [prefix] + [f"{k}={v}" for k, v in sorted(kwargs.items()) if k != "current_user"]
+            )
+
+            body = await response_cache.get(user_id, key)
+            if body is None:
+                result = await func(**kwargs)
+                if isinstance(result, StreamingResponse):
+                    # Buffer the stream so the full body can be cached
+                    body = b"".join([chunk async for chunk in result.body_iterator])
+                elif isinstance(result, Response):
+                    body = result.body
+                else:
+                    body = adapter.dump_json(adapter.validate_python(result, from_attributes=True))
+                await response_cache.set(user_id, key, body)
+
+            return Response(content=body, media_type="application/json")
+
+        return wrapper
+
+    return decorator
+
+
+class ResponseCacheInvalidationMiddleware:
+    """
+    Pure ASGI middleware that drops the authenticated user's cached responses
+    when a write request succeeds.
+
+    Invalidation runs as the response starts, i.e. after the endpoint has
+    committed, and before the client can observe the result. Must be installed
+    inside AuthSessionMiddleware so ``scope["state"]["user"]`` is populated.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] in SAFE_METHODS
+            or not response_cache.enabled
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        user = scope.get("state", {}).get("user")
+        if user is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                await response_cache.invalidate(user.id)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,16 +1,37 @@
 """
 Security utilities for authentication and authorization.
 """
-from datetime import datetime, timedelta
-from typing import Any, Union
+import asyncio
+import functools
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Callable, Optional, Tuple, TypeVar, Union
 
+import bcrypt
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 
 from app.core.config import settings
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt only uses the first 72 bytes of a password
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+# Dedicated pool for bcrypt so a burst of logins cannot exhaust the anyio
+# threadpool that FastAPI uses for sync dependencies and file I/O
+_pwd_pool = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="bcrypt"
+)
+
+T = TypeVar("T")
+
+# LRU of verified tokens: blake2b(token) -> (subject, exp)
+TOKEN_CACHE_SIZE = 4096
+_token_cache: "OrderedDict[bytes, Tuple[str, int]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
 
 
 def create_access_token(subject: Union[str, Any], expires_delta: timedelta = None) -> str:
@@ -25,13 +46,12 @@ def create_access_token(subject: Union[str, Any], expires_delta: timedelta = Non
         Encoded JWT token string
     """
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        lifetime = int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+        lifetime = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
     
-    to_encode = {"exp": expire, "sub": str(subject)}
+    # jose accepts an integer exp as-is, so skip building datetimes
+    to_encode = {"exp": int(time.time()) + lifetime, "sub": str(subject)}
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
@@ -47,7 +67,13 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return bcrypt.checkpw(
+            plain_password.encode()[:BCRYPT_MAX_PASSWORD_BYTES],
+            hashed_password.encode(),
+        )
+    except ValueError:
+        return False
 
 
 def get_password_hash(password: str) -> str:
@@ -60,26 +86,92 @@ def get_password_hash(password: str) -> str:
     Returns:
         Hashed password string
     """
-    return pwd_context.hash(password)
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode()[:BCRYPT_MAX_PASSWORD_BYTES], salt).decode()
+
+
+@functools.lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    """Hash checked in place of a missing user's, computed on first use."""
+    return get_password_hash("timing-equalization-dummy-password")
+
+
+def verify_user_password(plain_password: str, hashed_password: Optional[str]) -> bool:
+    """
+    Verify a login attempt, spending the same bcrypt work for unknown users.
+    
+    When the user does not exist a dummy hash is checked instead, so the
+    response time does not reveal whether the username is registered.
+    
+    Args:
+        plain_password: The plain text password to verify
+        hashed_password: The user's stored hash, or None if no user matched
+        
+    Returns:
+        True if the user exists and the password matches, False otherwise
+    """
+    if hashed_password is None:
+        verify_password(plain_password, _dummy_password_hash())
+        return False
+    return verify_password(plain_password, hashed_password)
+
+
+async def run_in_password_pool(func: Callable[..., T], *args: Any) -> T:
+    """
+    Run a CPU-bound password hashing function off the event loop.
+    
+    Args:
+        func: verify_password, verify_user_password or get_password_hash
+        *args: Positional arguments for func
+        
+    Returns:
+        The function's return value
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_pwd_pool, func, *args)
 
 
 def verify_token(token: str) -> Union[str, None]:
     """
     Verify and decode a JWT token.
     
+    Successfully verified tokens are remembered in a bounded LRU until they
+    expire, so repeat requests with the same token skip signature verification.
+    
     Args:
         token: The JWT token to verify
         
     Returns:
         The subject (user identifier) if token is valid, None otherwise
     """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = int(time.time())
+    
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+        if cached is not None:
+            subject, exp = cached
+            if exp > now:
+                _token_cache.move_to_end(key)
+                return subject
+            del _token_cache[key]
+    
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
-        subject: str = payload.get("sub")
-        if subject is None:
-            return None
-        return subject
     except JWTError:
-        return None
\ No newline at end of file
+        return None
+    
+    subject: str = payload.get("sub")
+    if subject is None:
+        return None
+    
+    exp = payload.get("exp")
+    if isinstance(exp, int):
+        with _token_cache_lock:
+            _token_cache[key] = (subject, exp)
+            if len(_token_cache) > TOKEN_CACHE_SIZE:
+                _token_cache.popitem(last=False)
+    
+    return subject
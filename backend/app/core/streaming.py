@@ -0,0 +1,50 @@
+"""
+Helpers for streaming large JSON list responses.
+"""
+from typing import Any, AsyncIterator
+
+import orjson
+from fastapi.responses import StreamingResponse
+
+# Rows serialized per chunk written to the client
+STREAM_BATCH_SIZE = 100
+
+
+async def _encode_json_array(
+    rows: AsyncIterator[Any], batch_size: int
+) -> AsyncIterator[bytes]:
+    """Encode rows as one JSON array, yielding a chunk every batch_size rows."""
+    batch = []
+    prefix = b"["
+    async for row in rows:
+        batch.append(orjson.dumps(row))
+        if len(batch) >= batch_size:
+            yield prefix + b",".join(batch)
+            prefix = b","
+            batch = []
+    if batch:
+        yield prefix + b",".join(batch) + b"]"
+    else:
+        # Either no rows at all ("[]") or the last batch was already flushed
+        yield b"[]" if prefix == b"[" else b"]"
+
+
+def json_array_response(
+    rows: AsyncIterator[Any], batch_size: int = STREAM_BATCH_SIZE
+) -> StreamingResponse:
+    """
+    Stream rows to the client as a JSON array while they are being fetched.
+    
+    Rows must already be JSON-ready for orjson (dicts of column values), so
+    no response model validation runs on this path.
+    
+    Args:
+        rows: Async iterator of rows to encode
+        batch_size: Rows serialized per chunk
+        
+    Returns:
+        StreamingResponse producing the JSON array
+    """
+    return StreamingResponse(
+        _encode_json_array(rows, batch_size), media_type="application/json"
+    )
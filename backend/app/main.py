@@ -5,12 +5,21 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import SQLAlchemyError
 from pydantic import ValidationError
 
 from app.core.config import settings
-from app.core.database import init_db, close_db
+from app.core.database import init_db, close_db, warm_pool
+from app.core.middleware import AuthSessionMiddleware
+from app.core.response_cache import ResponseCacheInvalidationMiddleware, response_cache
+from app.core.security import (
+    create_access_token,
+    run_in_password_pool,
+    verify_token,
+    verify_user_password,
+)
 from app.core.exceptions import (
     ProductivitySystemException,
     TimeAllocationExceeded,
@@ -36,8 +45,18 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
     await init_db()
+    # Open a few connections per worker now (DB_POOL_WARM_SIZE); the rest of
+    # the pool connects on demand so workers don't exhaust max_connections
+    await warm_pool()
+    # Warm the bcrypt pool thread, the unknown-user dummy hash and the JWT
+    # code paths so the first login doesn't pay their one-time setup cost
+    await run_in_password_pool(verify_user_password, "warmup", None)
+    verify_token(create_access_token("0"))
+    if settings.REDIS_URL:
+        await response_cache.connect(settings.REDIS_URL)
     yield
     # Shutdown
+    await response_cache.close()
     await close_db()
 
 
@@ -50,8 +69,17 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
+    # Drop the user's cached responses after successful writes; added first so
+    # it runs inside AuthSessionMiddleware and can see the resolved user
+    app.add_middleware(ResponseCacheInvalidationMiddleware)
+
+    # Open the request session and resolve the bearer token; added before CORS
+    # so CORS stays outermost and preflight requests never touch the database
+    app.add_middleware(AuthSessionMiddleware)
+
     # Configure CORS
     app.add_middleware(
         CORSMiddleware,
@@ -77,7 +105,9 @@ def create_app() -> FastAPI:
     app.include_router(auth.router)
     app.include_router(projects.router)
     app.include_router(goals.router)
+    app.include_router(goals.project_router)
     app.include_router(tasks.router)
+    app.include_router(tasks.goal_router)
     app.include_router(chores.router)
     app.include_router(habits.router)
 
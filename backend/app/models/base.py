@@ -2,15 +2,21 @@
 Base model classes with common fields and functionality.
 """
 from datetime import datetime
-from typing import Optional
+from typing import Any, ClassVar, Optional, Tuple, Type, TypeVar
 
+from sqlalchemy import Index, func, literal_column
 from sqlmodel import Field, SQLModel
 
+ReadModelT = TypeVar("ReadModelT", bound="ReadModel")
+
 
 class TimestampMixin(SQLModel):
     """Mixin class for adding timestamp fields to models."""
     created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
-    updated_at: Optional[datetime] = Field(default=None, nullable=True)
+    # Stamped by SQLAlchemy on every ORM flush or Core UPDATE of the row
+    updated_at: Optional[datetime] = Field(
+        default=None, nullable=True, sa_column_kwargs={"onupdate": datetime.utcnow}
+    )
 
 
 class BaseModel(TimestampMixin):
@@ -25,10 +31,51 @@ class BaseUserOwnedModel(BaseModel):
 
 class BaseNamedModel(BaseModel):
     """Base model for entities with name and description."""
-    name: str = Field(min_length=1, max_length=255, nullable=False, index=True)
+    name: str = Field(min_length=1, max_length=255, nullable=False)
     description: Optional[str] = Field(default=None, max_length=1000, nullable=True)
 
 
 class BaseUserOwnedNamedModel(BaseUserOwnedModel, BaseNamedModel):
     """Base model combining user ownership with name/description fields."""
-    pass
\ No newline at end of file
+    
+    # Indexed by each table's user_name_index() or another user_id-prefixed index
+    user_id: int = Field(foreign_key="user.id", nullable=False)
+
+
+def user_name_index(table_name: str) -> Index:
+    """
+    Build the (user_id, lower(name)) index for a user-owned named table.
+    
+    Serves per-user listings through its user_id prefix and keeps
+    case-insensitive name lookups within a user index-backed.
+    
+    Args:
+        table_name: Name of the table the index belongs to
+        
+    Returns:
+        Index to include in the model's ``__table_args__``
+    """
+    return Index(f"ix_{table_name}_user_lower_name", "user_id", func.lower(literal_column("name")))
+
+
+class ReadModel(SQLModel):
+    """Base class for response schemas built from trusted database rows."""
+    _field_names: ClassVar[Tuple[str, ...]] = ()
+    
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._field_names = tuple(cls.model_fields)
+    
+    @classmethod
+    def from_orm_fast(cls: Type[ReadModelT], obj: Any) -> ReadModelT:
+        """
+        Build the schema from an ORM object without running validation.
+        
+        Args:
+            obj: ORM instance whose attributes were loaded from the database
+            
+        Returns:
+            Schema instance populated from the object's attributes
+        """
+        return cls.model_construct(**{name: getattr(obj, name) for name in cls._field_names})
\ No newline at end of file
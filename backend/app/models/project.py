@@ -1,19 +1,42 @@
 """
 Project, Goal, and Task models for hierarchical project management.
 """
+import re
 from datetime import date, datetime
-from typing import List, Optional
+from typing import Annotated, List, Optional
 
-from pydantic import field_validator, model_validator
+from pydantic import AfterValidator, WithJsonSchema, model_validator
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
-from .base import BaseUserOwnedNamedModel
+from .base import BaseUserOwnedNamedModel, ReadModel, user_name_index
 from .enums import TaskStatus
 
+_HEX_COLOR_RE = re.compile(r'^#[0-9A-Fa-f]{6}$')
+
+
+def _validate_hex_color(v: str) -> str:
+    """Validate that a color is a #RRGGBB hex code."""
+    if _HEX_COLOR_RE.fullmatch(v) is None:
+        raise ValueError('Color must be a hex code like #1A2B3C')
+    return v
+
+
+# Shared by every model with a color field so the pattern is compiled once
+HexColor = Annotated[
+    str,
+    AfterValidator(_validate_hex_color),
+    WithJsonSchema({"type": "string", "pattern": _HEX_COLOR_RE.pattern}),
+]
+
 
 class Project(BaseUserOwnedNamedModel, table=True):
     """Project model for organizing work into meaningful categories."""
     
+    __table_args__ = (
+        user_name_index("project"),
+    )
+    
     weekly_hours: float = Field(
         gt=0,
         le=168,  # Maximum hours in a week
@@ -38,8 +61,7 @@ class Project(BaseUserOwnedNamedModel, table=True):
         description="Current project status"
     )
     
-    color: str = Field(
-        regex=r'^#[0-9A-Fa-f]{6}$',
+    color: HexColor = Field(
         nullable=False,
         description="Hex color code for project visualization"
     )
@@ -47,20 +69,23 @@ class Project(BaseUserOwnedNamedModel, table=True):
     # Relationships
     goals: List["Goal"] = Relationship(back_populates="project", cascade_delete=True)
     
-    @field_validator('end_date')
-    @classmethod
-    def validate_end_date(cls, v: Optional[date], info) -> Optional[date]:
+    @model_validator(mode='after')
+    def validate_end_date(self):
         """Validate that end_date is after start_date."""
-        if v is not None and 'start_date' in info.data:
-            start_date = info.data['start_date']
-            if v <= start_date:
-                raise ValueError('End date must be after start date')
-        return v
+        if self.end_date is not None and self.end_date <= self.start_date:
+            raise ValueError('End date must be after start date')
+        return self
 
 
 class Goal(BaseUserOwnedNamedModel, table=True):
     """Goal model for breaking down projects into manageable objectives."""
     
+    # Covers the per-project weekly_hours sums with an index-only scan
+    __table_args__ = (
+        Index("ix_goal_project_id_hours", "project_id", postgresql_include=["weekly_hours"]),
+        user_name_index("goal"),
+    )
+    
     weekly_hours: float = Field(
         gt=0,
         le=168,  # Maximum hours in a week
@@ -88,7 +113,6 @@ class Goal(BaseUserOwnedNamedModel, table=True):
     project_id: int = Field(
         foreign_key="project.id",
         nullable=False,
-        index=True,
         description="ID of the parent project"
     )
     
@@ -96,20 +120,23 @@ class Goal(BaseUserOwnedNamedModel, table=True):
     project: Project = Relationship(back_populates="goals")
     tasks: List["Task"] = Relationship(back_populates="goal", cascade_delete=True)
     
-    @field_validator('end_date')
-    @classmethod
-    def validate_end_date(cls, v: Optional[date], info) -> Optional[date]:
+    @model_validator(mode='after')
+    def validate_end_date(self):
         """Validate that end_date is after start_date."""
-        if v is not None and 'start_date' in info.data:
-            start_date = info.data['start_date']
-            if v <= start_date:
-                raise ValueError('End date must be after start date')
-        return v
+        if self.end_date is not None and self.end_date <= self.start_date:
+            raise ValueError('End date must be after start date')
+        return self
 
 
 class Task(BaseUserOwnedNamedModel, table=True):
     """Task model for breaking down goals into actionable items."""
     
+    # Covers the per-goal weekly_hours sums with an index-only scan
+    __table_args__ = (
+        Index("ix_task_goal_id_hours", "goal_id", postgresql_include=["weekly_hours"]),
+        user_name_index("task"),
+    )
+    
     weekly_hours: float = Field(
         gt=0,
         le=168,  # Maximum hours in a week
@@ -145,22 +172,22 @@ class Task(BaseUserOwnedNamedModel, table=True):
     goal_id: int = Field(
         foreign_key="goal.id",
         nullable=False,
-        index=True,
         description="ID of the parent goal"
     )
     
     # Relationships
     goal: Goal = Relationship(back_populates="tasks")
     
-    @field_validator('end_time')
-    @classmethod
-    def validate_end_time(cls, v: Optional[datetime], info) -> Optional[datetime]:
+    @model_validator(mode='after')
+    def validate_end_time(self):
         """Validate that end_time is after start_time."""
-        if v is not None and 'start_time' in info.data:
-            start_time = info.data['start_time']
-            if start_time is not None and v <= start_time:
-                raise ValueError('End time must be after start time')
-        return v
+        if (
+            self.end_time is not None
+            and self.start_time is not None
+            and self.end_time <= self.start_time
+        ):
+            raise ValueError('End time must be after start time')
+        return self
 
 
 # Pydantic models for API requests/responses
@@ -173,17 +200,14 @@ class ProjectCreate(SQLModel):
     start_date: date
     end_date: Optional[date] = None
     status: TaskStatus = TaskStatus.NOT_STARTED
-    color: str = Field(regex=r'^#[0-9A-Fa-f]{6}$')
+    color: HexColor
     
-    @field_validator('end_date')
-    @classmethod
-    def validate_end_date(cls, v: Optional[date], info) -> Optional[date]:
+    @model_validator(mode='after')
+    def validate_end_date(self):
         """Validate that end_date is after start_date."""
-        if v is not None and 'start_date' in info.data:
-            start_date = info.data['start_date']
-            if v <= start_date:
-                raise ValueError('End date must be after start date')
-        return v
+        if self.end_date is not None and self.end_date <= self.start_date:
+            raise ValueError('End date must be after start date')
+        return self
 
 
 class ProjectUpdate(SQLModel):
@@ -194,10 +218,10 @@ class ProjectUpdate(SQLModel):
     start_date: Optional[date] = None
     end_date: Optional[date] = None
     status: Optional[TaskStatus] = None
-    color: Optional[str] = Field(default=None, regex=r'^#[0-9A-Fa-f]{6}$')
+    color: Optional[HexColor] = None
 
 
-class ProjectRead(SQLModel):
+class ProjectRead(ReadModel):
     """Schema for reading project data."""
     id: int
     name: str
@@ -221,15 +245,12 @@ class GoalCreate(SQLModel):
     end_date: Optional[date] = None
     status: TaskStatus = TaskStatus.NOT_STARTED
     
-    @field_validator('end_date')
-    @classmethod
-    def validate_end_date(cls, v: Optional[date], info) -> Optional[date]:
+    @model_validator(mode='after')
+    def validate_end_date(self):
         """Validate that end_date is after start_date."""
-        if v is not None and 'start_date' in info.data:
-            start_date = info.data['start_date']
-            if v <= start_date:
-                raise ValueError('End date must be after start date')
-        return v
+        if self.end_date is not None and self.end_date <= self.start_date:
+            raise ValueError('End date must be after start date')
+        return self
 
 
 class GoalUpdate(SQLModel):
@@ -242,7 +263,7 @@ class GoalUpdate(SQLModel):
     status: Optional[TaskStatus] = None
 
 
-class GoalRead(SQLModel):
+class GoalRead(ReadModel):
     """Schema for reading goal data."""
     id: int
     name: str
@@ -267,15 +288,16 @@ class TaskCreate(SQLModel):
     eta_hours: Optional[float] = Field(default=None, gt=0)
     status: TaskStatus = TaskStatus.NOT_STARTED
     
-    @field_validator('end_time')
-    @classmethod
-    def validate_end_time(cls, v: Optional[datetime], info) -> Optional[datetime]:
+    @model_validator(mode='after')
+    def validate_end_time(self):
         """Validate that end_time is after start_time."""
-        if v is not None and 'start_time' in info.data:
-            start_time = info.data['start_time']
-            if start_time is not None and v <= start_time:
-                raise ValueError('End time must be after start time')
-        return v
+        if (
+            self.end_time is not None
+            and self.start_time is not None
+            and self.end_time <= self.start_time
+        ):
+            raise ValueError('End time must be after start time')
+        return self
 
 
 class TaskUpdate(SQLModel):
@@ -289,7 +311,7 @@ class TaskUpdate(SQLModel):
     status: Optional[TaskStatus] = None
 
 
-class TaskRead(SQLModel):
+class TaskRead(ReadModel):
     """Schema for reading task data."""
     id: int
     name: str
@@ -302,4 +324,5 @@ class TaskRead(SQLModel):
     goal_id: int
     user_id: int
     created_at: datetime
-    updated_at: Optional[datetime]
\ No newline at end of file
+    updated_at: Optional[datetime]
+
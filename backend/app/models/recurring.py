@@ -4,14 +4,36 @@ Recurring items models for Chores and Habits.
 from datetime import date, datetime, timedelta
 from typing import Optional
 
-from pydantic import field_validator, model_validator
+from pydantic import model_validator
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
-from .base import BaseUserOwnedNamedModel
+from .base import BaseUserOwnedNamedModel, ReadModel, user_name_index
 from .enums import TaskStatus, FrequencyType
 
+# Fixed recurrence intervals; CUSTOM uses frequency_value days instead
+_FREQUENCY_DELTAS = {
+    FrequencyType.DAILY: timedelta(days=1),
+    FrequencyType.WEEKLY: timedelta(weeks=1),
+    FrequencyType.BIWEEKLY: timedelta(weeks=2),
+    # One month, approximated as 30 days for simplicity
+    FrequencyType.MONTHLY: timedelta(days=30),
+}
 
-class RecurringItemBase(BaseUserOwnedNamedModel):
+class RecurringScheduleMixin(SQLModel):
+    """Mixin validating the schedule fields shared by recurring item models."""
+    
+    @model_validator(mode='after')
+    def validate_schedule(self):
+        """Validate that end_time is after start_time and frequency_value fits frequency_type."""
+        if self.start_time is not None and self.end_time is not None and self.end_time <= self.start_time:
+            raise ValueError('End time must be after start time')
+        if self.frequency_type != FrequencyType.CUSTOM and self.frequency_value != 1:
+            raise ValueError('Frequency value must be 1 for non-custom frequency types')
+        return self
+
+
+class RecurringItemBase(RecurringScheduleMixin, BaseUserOwnedNamedModel):
     """Base model for recurring items (chores and habits)."""
     
     start_time: Optional[datetime] = Field(
@@ -62,54 +84,40 @@ class RecurringItemBase(BaseUserOwnedNamedModel):
         description="Date when this item was last completed"
     )
     
-    @field_validator('end_time')
-    @classmethod
-    def validate_end_time(cls, v: Optional[datetime], info) -> Optional[datetime]:
-        """Validate that end_time is after start_time."""
-        if v is not None and 'start_time' in info.data:
-            start_time = info.data['start_time']
-            if start_time is not None and v <= start_time:
-                raise ValueError('End time must be after start time')
-        return v
-    
-    @field_validator('frequency_value')
-    @classmethod
-    def validate_frequency_value(cls, v: int, info) -> int:
-        """Validate frequency_value based on frequency_type."""
-        if 'frequency_type' in info.data:
-            frequency_type = info.data['frequency_type']
-            if frequency_type != FrequencyType.CUSTOM and v != 1:
-                raise ValueError('Frequency value must be 1 for non-custom frequency types')
-        return v
+    def recurrence_interval(self) -> timedelta:
+        """Get the time between occurrences for this item's frequency settings."""
+        delta = _FREQUENCY_DELTAS.get(self.frequency_type)
+        if delta is not None:
+            return delta
+        if self.frequency_type == FrequencyType.CUSTOM:
+            return timedelta(days=self.frequency_value)
+        raise ValueError(f"Unknown frequency type: {self.frequency_type}")
     
     def calculate_next_due_date(self, completion_date: Optional[date] = None) -> date:
         """Calculate the next due date based on frequency settings."""
         base_date = completion_date or self.last_completed_date or date.today()
-        
-        if self.frequency_type == FrequencyType.DAILY:
-            return base_date + timedelta(days=1)
-        elif self.frequency_type == FrequencyType.WEEKLY:
-            return base_date + timedelta(weeks=1)
-        elif self.frequency_type == FrequencyType.BIWEEKLY:
-            return base_date + timedelta(weeks=2)
-        elif self.frequency_type == FrequencyType.MONTHLY:
-            # Add one month (approximate with 30 days for simplicity)
-            # In a real implementation, you might want to use dateutil.relativedelta
-            return base_date + timedelta(days=30)
-        elif self.frequency_type == FrequencyType.CUSTOM:
-            return base_date + timedelta(days=self.frequency_value)
-        else:
-            raise ValueError(f"Unknown frequency type: {self.frequency_type}")
+        return base_date + self.recurrence_interval()
 
 
 class Chore(RecurringItemBase, table=True):
     """Chore model for recurring maintenance tasks."""
-    pass
+    
+    # Serves the per-user listing and the due-date range scan
+    __table_args__ = (
+        Index("ix_chore_user_next_due", "user_id", "next_due_date"),
+        user_name_index("chore"),
+    )
 
 
 class Habit(RecurringItemBase, table=True):
     """Habit model for recurring positive routines with streak tracking."""
     
+    # Serves the per-user listing and the due-date range scan
+    __table_args__ = (
+        Index("ix_habit_user_next_due", "user_id", "next_due_date"),
+        user_name_index("habit"),
+    )
+    
     streak_count: int = Field(
         default=0,
         ge=0,
@@ -117,16 +125,26 @@ class Habit(RecurringItemBase, table=True):
         description="Current streak count for this habit"
     )
     
-    def update_streak(self, completion_date: date) -> int:
-        """Update streak count based on completion date."""
+    def update_streak(self, completion_date: date, interval: Optional[timedelta] = None) -> int:
+        """
+        Update streak count based on completion date.
+        
+        Args:
+            completion_date: Date of the new completion
+            interval: This habit's recurrence_interval(), if the caller already has it
+            
+        Returns:
+            The updated streak count
+        """
         if self.last_completed_date is None:
             # First completion
             self.streak_count = 1
         else:
             # Check if completion is consecutive based on frequency
             if self.frequency_type == FrequencyType.DAILY:
-                # For daily habits, check if completed within 1 day of last completion
-                days_since_last = (completion_date - self.last_completed_date).days
+                # For daily habits, check if completed within 1 day of last completion;
+                # ordinals compare as plain ints without building a timedelta
+                days_since_last = completion_date.toordinal() - self.last_completed_date.toordinal()
                 if days_since_last <= 1:
                     self.streak_count += 1
                 else:
@@ -134,7 +152,7 @@ class Habit(RecurringItemBase, table=True):
                     self.streak_count = 1
             else:
                 # For non-daily habits, check if completed on or before next due date
-                expected_date = self.calculate_next_due_date(self.last_completed_date)
+                expected_date = self.last_completed_date + (interval or self.recurrence_interval())
                 if completion_date <= expected_date:
                     self.streak_count += 1
                 else:
@@ -146,7 +164,7 @@ class Habit(RecurringItemBase, table=True):
 
 # Pydantic models for API requests/responses
 
-class ChoreCreate(SQLModel):
+class ChoreCreate(RecurringScheduleMixin):
     """Schema for creating a new chore."""
     name: str = Field(min_length=1, max_length=255)
     description: Optional[str] = Field(default=None, max_length=1000)
@@ -157,26 +175,6 @@ class ChoreCreate(SQLModel):
     frequency_type: FrequencyType
     frequency_value: int = Field(default=1, gt=0)
     next_due_date: date
-    
-    @field_validator('end_time')
-    @classmethod
-    def validate_end_time(cls, v: Optional[datetime], info) -> Optional[datetime]:
-        """Validate that end_time is after start_time."""
-        if v is not None and 'start_time' in info.data:
-            start_time = info.data['start_time']
-            if start_time is not None and v <= start_time:
-                raise ValueError('End time must be after start time')
-        return v
-    
-    @field_validator('frequency_value')
-    @classmethod
-    def validate_frequency_value(cls, v: int, info) -> int:
-        """Validate frequency_value based on frequency_type."""
-        if 'frequency_type' in info.data:
-            frequency_type = info.data['frequency_type']
-            if frequency_type != FrequencyType.CUSTOM and v != 1:
-                raise ValueError('Frequency value must be 1 for non-custom frequency types')
-        return v
 
 
 class ChoreUpdate(SQLModel):
@@ -192,7 +190,7 @@ class ChoreUpdate(SQLModel):
     next_due_date: Optional[date] = None
 
 
-class ChoreRead(SQLModel):
+class ChoreRead(ReadModel):
     """Schema for reading chore data."""
     id: int
     name: str
@@ -210,7 +208,7 @@ class ChoreRead(SQLModel):
     updated_at: Optional[datetime]
 
 
-class HabitCreate(SQLModel):
+class HabitCreate(RecurringScheduleMixin):
     """Schema for creating a new habit."""
     name: str = Field(min_length=1, max_length=255)
     description: Optional[str] = Field(default=None, max_length=1000)
@@ -221,26 +219,6 @@ class HabitCreate(SQLModel):
     frequency_type: FrequencyType
     frequency_value: int = Field(default=1, gt=0)
     next_due_date: date
-    
-    @field_validator('end_time')
-    @classmethod
-    def validate_end_time(cls, v: Optional[datetime], info) -> Optional[datetime]:
-        """Validate that end_time is after start_time."""
-        if v is not None and 'start_time' in info.data:
-            start_time = info.data['start_time']
-            if start_time is not None and v <= start_time:
-                raise ValueError('End time must be after start time')
-        return v
-    
-    @field_validator('frequency_value')
-    @classmethod
-    def validate_frequency_value(cls, v: int, info) -> int:
-        """Validate frequency_value based on frequency_type."""
-        if 'frequency_type' in info.data:
-            frequency_type = info.data['frequency_type']
-            if frequency_type != FrequencyType.CUSTOM and v != 1:
-                raise ValueError('Frequency value must be 1 for non-custom frequency types')
-        return v
 
 
 class HabitUpdate(SQLModel):
@@ -256,7 +234,7 @@ class HabitUpdate(SQLModel):
     next_due_date: Optional[date] = None
 
 
-class HabitRead(SQLModel):
+class HabitRead(ReadModel):
     """Schema for reading habit data."""
     id: int
     name: str
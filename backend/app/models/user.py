@@ -1,6 +1,7 @@
 """
 User model for authentication and user management.
 """
+import string
 from datetime import datetime
 from typing import Optional
 
@@ -9,6 +10,9 @@ from sqlmodel import Field, SQLModel
 
 from .base import BaseModel
 
+# Characters allowed in usernames; issuperset() checks a name in one C call
+USERNAME_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
 
 class User(BaseModel, table=True):
     """User model for authentication and user management."""
@@ -54,8 +58,7 @@ class UserCreate(SQLModel):
     def validate_username(cls, v: str) -> str:
         """Validate username format."""
         # Check if username contains only allowed characters
-        allowed_chars = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-')
-        if not all(c in allowed_chars for c in v):
+        if not USERNAME_CHARS.issuperset(v):
             raise ValueError('Username can only contain letters, numbers, underscores, and hyphens')
         return v.lower()
     
@@ -88,8 +91,7 @@ class UserUpdate(SQLModel):
         if v is None:
             return v
         # Check if username contains only allowed characters
-        allowed_chars = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-')
-        if not all(c in allowed_chars for c in v):
+        if not USERNAME_CHARS.issuperset(v):
             raise ValueError('Username can only contain letters, numbers, underscores, and hyphens')
         return v.lower()
     
@@ -0,0 +1,159 @@
+"""
+Helpers shared by the repository classes.
+"""
+import functools
+from typing import Any, ClassVar, Generic, List, Optional, Type, TypeVar
+
+from sqlalchemy import bindparam, delete, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+from sqlalchemy.sql import Select
+from sqlmodel import SQLModel, select
+
+from app.core.database import get_request_session
+
+ModelT = TypeVar("ModelT", bound=SQLModel)
+
+
+def apply_update(target: Any, update_model: SQLModel) -> None:
+    """
+    Copy the fields explicitly set on an update schema onto an ORM object.
+    
+    Iterates the schema's fields-set directly rather than building an
+    intermediate dict with model_dump(exclude_unset=True).
+    
+    Args:
+        target: ORM object to modify
+        update_model: Partial update schema
+    """
+    for name in update_model.model_fields_set:
+        setattr(target, name, getattr(update_model, name))
+
+
+@functools.lru_cache(maxsize=None)
+def select_for_user(model: Type[SQLModel]) -> Select:
+    """
+    Build, once per model, a SELECT of a user's rows with a bound user_id.
+    
+    Relationships are raiseload()ed so list serialization can never fall
+    into per-row lazy loads.
+    
+    Args:
+        model: User-owned table model
+        
+    Returns:
+        Statement taking a ``user_id`` parameter
+    """
+    return (
+        select(model)
+        .options(raiseload("*"))
+        .where(model.user_id == bindparam("user_id"))
+    )
+
+
+class CrudRepository(Generic[ModelT]):
+    """
+    Base class for repositories of user-owned table models.
+    
+    Subclasses set ``model`` and add their create/update logic; lookups,
+    listing, saving and deleting are shared.
+    """
+    
+    model: ClassVar[Type[SQLModel]]
+    
+    def __init__(self, session: Optional[AsyncSession] = None):
+        self.session = session if session is not None else get_request_session()
+    
+    async def get_by_id(self, item_id: int, user_id: int) -> Optional[ModelT]:
+        """
+        Get an item by ID for a specific user.
+        
+        Args:
+            item_id: Primary key of the item
+            user_id: ID of the user
+            
+        Returns:
+            The item if found and owned by the user, None otherwise
+        """
+        # Primary-key lookup goes through the identity map before issuing SQL
+        item = await self.session.get(self.model, item_id)
+        if item is None or item.user_id != user_id:
+            return None
+        return item
+    
+    async def get_all_by_user(self, user_id: int) -> List[ModelT]:
+        """
+        Get all items owned by a user.
+        
+        Args:
+            user_id: ID of the user
+            
+        Returns:
+            List of items
+        """
+        result = await self.session.execute(select_for_user(self.model), {"user_id": user_id})
+        return result.scalars().all()
+    
+    async def _save(self, item: ModelT) -> ModelT:
+        """Add an item to the session and commit it."""
+        self.session.add(item)
+        await self.session.commit()
+        return item
+    
+    async def _remove(self, item: ModelT) -> None:
+        """Delete an item and commit."""
+        await self.session.delete(item)
+        await self.session.commit()
+    
+    async def _update_by_id(
+        self, item_id: int, user_id: int, update_model: SQLModel
+    ) -> Optional[ModelT]:
+        """
+        Apply a partial update to a user's item in one UPDATE ... RETURNING.
+        
+        Args:
+            item_id: Primary key of the item
+            user_id: ID of the user
+            update_model: Partial update schema; only its set fields are written
+            
+        Returns:
+            The updated item, or None if no item matched
+        """
+        values = {name: getattr(update_model, name) for name in update_model.model_fields_set}
+        if not values:
+            return await self.get_by_id(item_id, user_id)
+        
+        statement = (
+            update(self.model)
+            .where(self.model.id == item_id, self.model.user_id == user_id)
+            .values(**values)
+            .returning(self.model)
+            .execution_options(populate_existing=True, synchronize_session=False)
+        )
+        item = await self.session.scalar(statement)
+        await self.session.commit()
+        return item
+    
+    async def _delete_by_id(self, item_id: int, user_id: int) -> bool:
+        """
+        Delete a user's item in one DELETE ... RETURNING.
+        
+        Bypasses ORM relationship cascades, so only use it for models
+        without dependent rows.
+        
+        Args:
+            item_id: Primary key of the item
+            user_id: ID of the user
+            
+        Returns:
+            True if an item was deleted, False if none matched
+        """
+        statement = (
+            delete(self.model)
+            .where(self.model.id == item_id, self.model.user_id == user_id)
+            .returning(self.model.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = await self.session.scalar(statement) is not None
+        await self.session.commit()
+        return deleted
@@ -2,73 +2,74 @@
 Repository for chore operations.
 """
 from datetime import date
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import bindparam
 from sqlmodel import select
 
-from app.models.recurring import Chore, ChoreCreate, ChoreUpdate
+from app.models.enums import TaskStatus
+from app.models.recurring import Chore, ChoreCreate, ChoreRead, ChoreUpdate
+from app.repositories.base import CrudRepository
 
+# Columns serialized by ChoreRead, selected directly for streamed list reads
+_CHORE_READ_COLUMNS = [getattr(Chore, name) for name in ChoreRead.model_fields]
 
-class ChoreRepository:
+# Rows fetched from the server per round trip while streaming
+_STREAM_YIELD_PER = 500
+
+# Statements built once at import and executed with bound parameters
+_CHORE_ROWS_FOR_USER = (
+    select(*_CHORE_READ_COLUMNS)
+    .where(Chore.user_id == bindparam("user_id"))
+    .execution_options(yield_per=_STREAM_YIELD_PER)
+)
+
+_DUE_CHORE_ROWS = (
+    select(*_CHORE_READ_COLUMNS)
+    .where(Chore.user_id == bindparam("user_id"), Chore.next_due_date <= bindparam("due_date"))
+    .execution_options(yield_per=_STREAM_YIELD_PER)
+)
+
+
+class ChoreRepository(CrudRepository[Chore]):
     """Repository for chore CRUD operations."""
     
-    def __init__(self, session: AsyncSession):
-        self.session = session
+    model = Chore
     
     async def create(self, chore_data: ChoreCreate, user_id: int) -> Chore:
         """Create a new chore."""
         chore = Chore(
-            **chore_data.model_dump(),
+            **chore_data.__dict__,
             user_id=user_id
         )
-        self.session.add(chore)
-        await self.session.commit()
-        await self.session.refresh(chore)
-        return chore
+        return await self._save(chore)
     
-    async def get_by_id(self, chore_id: int, user_id: int) -> Optional[Chore]:
-        """Get a chore by ID for a specific user."""
-        statement = select(Chore).where(
-            Chore.id == chore_id,
-            Chore.user_id == user_id
-        )
-        result = await self.session.execute(statement)
-        return result.scalar_one_or_none()
-    
-    async def get_all_by_user(self, user_id: int) -> List[Chore]:
-        """Get all chores for a user."""
-        statement = select(Chore).where(Chore.user_id == user_id)
-        result = await self.session.execute(statement)
-        return list(result.scalars().all())
+    async def stream_all_by_user_rows(self, user_id: int) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a user's chores as plain column dicts, in server-side batches."""
+        result = await self.session.stream(_CHORE_ROWS_FOR_USER, {"user_id": user_id})
+        async for row in result.mappings():
+            yield dict(row)
     
-    async def get_due_chores(self, user_id: int, due_date: Optional[date] = None) -> List[Chore]:
-        """Get chores that are due on or before the specified date."""
+    async def stream_due_rows(
+        self, user_id: int, due_date: Optional[date] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream chores due on or before a date as plain column dicts."""
         if due_date is None:
             due_date = date.today()
         
-        statement = select(Chore).where(
-            Chore.user_id == user_id,
-            Chore.next_due_date <= due_date
+        result = await self.session.stream(
+            _DUE_CHORE_ROWS, {"user_id": user_id, "due_date": due_date}
         )
-        result = await self.session.execute(statement)
-        return list(result.scalars().all())
+        async for row in result.mappings():
+            yield dict(row)
     
-    async def update(self, chore: Chore, chore_data: ChoreUpdate) -> Chore:
-        """Update a chore."""
-        update_data = chore_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(chore, field, value)
-        
-        self.session.add(chore)
-        await self.session.commit()
-        await self.session.refresh(chore)
-        return chore
+    async def update(self, chore_id: int, chore_data: ChoreUpdate, user_id: int) -> Optional[Chore]:
+        """Update a chore, returning None if the user has no such chore."""
+        return await self._update_by_id(chore_id, user_id, chore_data)
     
-    async def delete(self, chore: Chore) -> None:
-        """Delete a chore."""
-        await self.session.delete(chore)
-        await self.session.commit()
+    async def delete(self, chore_id: int, user_id: int) -> bool:
+        """Delete a chore, returning False if the user has no such chore."""
+        return await self._delete_by_id(chore_id, user_id)
     
     async def complete_chore(self, chore: Chore, completion_date: Optional[date] = None) -> Chore:
         """Mark a chore as completed and update next due date."""
@@ -80,10 +81,6 @@ class ChoreRepository:
         chore.next_due_date = chore.calculate_next_due_date(completion_date)
         
         # Reset status to not started for the next occurrence
-        from app.models.enums import TaskStatus
         chore.status = TaskStatus.NOT_STARTED
         
-        self.session.add(chore)
-        await self.session.commit()
-        await self.session.refresh(chore)
-        return chore
\ No newline at end of file
+        return await self._save(chore)
\ No newline at end of file
@@ -1,21 +1,48 @@
 """
 Repository for Goal CRUD operations.
 """
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
+from sqlalchemy import bindparam, literal_column
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
-from app.models.project import Goal, GoalCreate, GoalUpdate, Project
+from app.core.exceptions import ResourceNotFound
+from app.models.project import Goal, GoalCreate, GoalRead, GoalUpdate, Project
 from app.services.time_allocation import TimeAllocationService
+from app.repositories.base import CrudRepository
 
+# Columns serialized by GoalRead, selected directly for list reads
+_GOAL_READ_COLUMNS = [getattr(Goal, name) for name in GoalRead.model_fields]
 
-class GoalRepository:
+# Statements built once at import and executed with bound parameters
+_PROJECT_OWNED = select(literal_column("1")).where(
+    Project.id == bindparam("project_id"),
+    Project.user_id == bindparam("user_id")
+).limit(1)
+
+_GOAL_ROWS_FOR_PROJECT = (
+    select(*_GOAL_READ_COLUMNS)
+    .join(Project, Goal.project_id == Project.id)
+    .where(Goal.project_id == bindparam("project_id"), Project.user_id == bindparam("user_id"))
+    .order_by(Goal.created_at.desc())
+)
+
+_GOAL_ROWS_FOR_USER = (
+    select(*_GOAL_READ_COLUMNS)
+    .where(Goal.user_id == bindparam("user_id"))
+    .order_by(Goal.created_at.desc())
+)
+
+
+class GoalRepository(CrudRepository[Goal]):
     """Repository for Goal CRUD operations."""
     
-    def __init__(self, session: AsyncSession):
-        self.session = session
-        self.time_service = TimeAllocationService(session)
+    model = Goal
+    
+    def __init__(self, session: Optional[AsyncSession] = None):
+        super().__init__(session)
+        self.time_service = TimeAllocationService.for_session(self.session)
     
     async def create(self, goal_data: GoalCreate, project_id: int, user_id: int) -> Goal:
         """
@@ -30,19 +57,16 @@ class GoalRepository:
             Created goal
             
         Raises:
-            ValueError: If project not found or doesn't belong to user
-            TimeAllocationError: If hours would exceed project allocation
+            ResourceNotFound: If project not found or doesn't belong to user
+            TimeAllocationExceeded: If hours would exceed project allocation
         """
-        # Verify project exists and belongs to user
-        project_stmt = select(Project).where(
-            Project.id == project_id,
-            Project.user_id == user_id
+        # Verify project exists and belongs to user without loading the row
+        owned = await self.session.scalar(
+            _PROJECT_OWNED, {"project_id": project_id, "user_id": user_id}
         )
-        project_result = await self.session.execute(project_stmt)
-        project = project_result.scalar_one_or_none()
         
-        if not project:
-            raise ValueError(f"Project with ID {project_id} not found or access denied")
+        if owned is None:
+            raise ResourceNotFound("Project", project_id)
         
         # Validate time allocation
         await self.time_service.validate_goal_hours_for_project(
@@ -50,73 +74,50 @@ class GoalRepository:
         )
         
         goal = Goal(
-            **goal_data.model_dump(),
+            **goal_data.__dict__,
             project_id=project_id,
             user_id=user_id
         )
         
-        self.session.add(goal)
-        await self.session.commit()
-        await self.session.refresh(goal)
-        return goal
+        return await self._save(goal)
     
-    async def get_by_id(self, goal_id: int, user_id: int) -> Optional[Goal]:
+    async def stream_all_for_project(self, project_id: int, user_id: int) -> AsyncIterator[Dict[str, Any]]:
         """
-        Get a goal by ID for a specific user.
+        Stream all goals for a project as plain column dicts.
         
-        Args:
-            goal_id: ID of the goal
-            user_id: ID of the user
-            
-        Returns:
-            Goal if found, None otherwise
-        """
-        statement = select(Goal).where(
-            Goal.id == goal_id,
-            Goal.user_id == user_id
-        )
-        result = await self.session.execute(statement)
-        return result.scalar_one_or_none()
-    
-    async def get_all_for_project(self, project_id: int, user_id: int) -> List[Goal]:
-        """
-        Get all goals for a project.
+        Selects only the columns exposed by GoalRead and yields rows as the
+        database returns them, without ORM instances or a full result list.
         
         Args:
             project_id: ID of the project
             user_id: ID of the user
             
-        Returns:
-            List of goals
+        Yields:
+            Goal column mappings
         """
-        # Verify project belongs to user
-        project_stmt = select(Project).where(
-            Project.id == project_id,
-            Project.user_id == user_id
+        # Ownership is checked in the same round trip via the join
+        result = await self.session.stream(
+            _GOAL_ROWS_FOR_PROJECT, {"project_id": project_id, "user_id": user_id}
         )
-        project_result = await self.session.execute(project_stmt)
-        project = project_result.scalar_one_or_none()
-        
-        if not project:
-            return []
-        
-        statement = select(Goal).where(Goal.project_id == project_id).order_by(Goal.created_at.desc())
-        result = await self.session.execute(statement)
-        return result.scalars().all()
+        async for row in result.mappings():
+            yield dict(row)
     
-    async def get_all_for_user(self, user_id: int) -> List[Goal]:
+    async def stream_all_for_user_rows(self, user_id: int) -> AsyncIterator[Dict[str, Any]]:
         """
-        Get all goals for a user.
+        Stream all goals for a user as plain column dicts.
+        
+        Selects only the columns exposed by GoalRead and yields rows as the
+        database returns them, without ORM instances or a full result list.
         
         Args:
             user_id: ID of the user
             
-        Returns:
-            List of goals
+        Yields:
+            Goal column mappings
         """
-        statement = select(Goal).where(Goal.user_id == user_id).order_by(Goal.created_at.desc())
-        result = await self.session.execute(statement)
-        return result.scalars().all()
+        result = await self.session.stream(_GOAL_ROWS_FOR_USER, {"user_id": user_id})
+        async for row in result.mappings():
+            yield dict(row)
     
     async def update(self, goal_id: int, goal_data: GoalUpdate, user_id: int) -> Optional[Goal]:
         """
@@ -133,31 +134,20 @@ class GoalRepository:
         Raises:
             TimeAllocationError: If hours update would violate constraints
         """
-        # Get existing goal
-        goal = await self.get_by_id(goal_id, user_id)
-        if not goal:
-            return None
-        
-        # Validate hours update if provided
+        # Validate hours update if provided; only this needs the current row
         if goal_data.weekly_hours is not None:
-            # Check if new hours would violate project constraints
-            await self.time_service.validate_goal_hours_for_project(
-                goal.project_id, goal_data.weekly_hours, exclude_goal_id=goal_id
-            )
+            goal = await self.get_by_id(goal_id, user_id)
+            if not goal:
+                return None
             
-            # Check if new hours would violate existing task allocations
-            await self.time_service.validate_goal_hours_update(
-                goal_id, goal_data.weekly_hours
+            # Check project and task constraints in one round trip; both checks
+            # share this request's session, so they cannot run concurrently
+            await self.time_service.validate_goal_hours_change(
+                goal_id, goal.project_id, goal_data.weekly_hours
             )
         
-        # Update fields
-        update_data = goal_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(goal, field, value)
-        
-        await self.session.commit()
-        await self.session.refresh(goal)
-        return goal
+        # Write the changes and read the updated row back in one round trip
+        return await self._update_by_id(goal_id, user_id, goal_data)
     
     async def delete(self, goal_id: int, user_id: int) -> bool:
         """
@@ -174,8 +164,7 @@ class GoalRepository:
         if not goal:
             return False
         
-        await self.session.delete(goal)
-        await self.session.commit()
+        await self._remove(goal)
         return True
     
     async def get_allocation_summary(self, goal_id: int, user_id: int) -> Optional[dict]:
@@ -189,9 +178,8 @@ class GoalRepository:
         Returns:
             Allocation summary if goal found, None otherwise
         """
-        # Verify goal belongs to user
-        goal = await self.get_by_id(goal_id, user_id)
-        if not goal:
-            return None
-        
-        return await self.time_service.get_goal_allocation_summary(goal_id)
\ No newline at end of file
+        # Ownership is checked by the summary query itself
+        try:
+            return await self.time_service.get_goal_allocation_summary(goal_id, user_id)
+        except ResourceNotFound:
+            return None
\ No newline at end of file
@@ -2,91 +2,89 @@
 Repository for habit operations.
 """
 from datetime import date
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import bindparam
 from sqlmodel import select
 
-from app.models.recurring import Habit, HabitCreate, HabitUpdate
+from app.models.enums import TaskStatus
+from app.models.recurring import Habit, HabitCreate, HabitRead, HabitUpdate
+from app.repositories.base import CrudRepository
 
+# Columns serialized by HabitRead, selected directly for streamed list reads
+_HABIT_READ_COLUMNS = [getattr(Habit, name) for name in HabitRead.model_fields]
 
-class HabitRepository:
+# Rows fetched from the server per round trip while streaming
+_STREAM_YIELD_PER = 500
+
+# Statements built once at import and executed with bound parameters
+_HABIT_ROWS_FOR_USER = (
+    select(*_HABIT_READ_COLUMNS)
+    .where(Habit.user_id == bindparam("user_id"))
+    .execution_options(yield_per=_STREAM_YIELD_PER)
+)
+
+_DUE_HABIT_ROWS = (
+    select(*_HABIT_READ_COLUMNS)
+    .where(Habit.user_id == bindparam("user_id"), Habit.next_due_date <= bindparam("due_date"))
+    .execution_options(yield_per=_STREAM_YIELD_PER)
+)
+
+
+class HabitRepository(CrudRepository[Habit]):
     """Repository for habit CRUD operations."""
     
-    def __init__(self, session: AsyncSession):
-        self.session = session
+    model = Habit
     
     async def create(self, habit_data: HabitCreate, user_id: int) -> Habit:
         """Create a new habit."""
         habit = Habit(
-            **habit_data.model_dump(),
+            **habit_data.__dict__,
             user_id=user_id
         )
-        self.session.add(habit)
-        await self.session.commit()
-        await self.session.refresh(habit)
-        return habit
+        return await self._save(habit)
     
-    async def get_by_id(self, habit_id: int, user_id: int) -> Optional[Habit]:
-        """Get a habit by ID for a specific user."""
-        statement = select(Habit).where(
-            Habit.id == habit_id,
-            Habit.user_id == user_id
-        )
-        result = await self.session.execute(statement)
-        return result.scalar_one_or_none()
-    
-    async def get_all_by_user(self, user_id: int) -> List[Habit]:
-        """Get all habits for a user."""
-        statement = select(Habit).where(Habit.user_id == user_id)
-        result = await self.session.execute(statement)
-        return list(result.scalars().all())
+    async def stream_all_by_user_rows(self, user_id: int) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a user's habits as plain column dicts, in server-side batches."""
+        result = await self.session.stream(_HABIT_ROWS_FOR_USER, {"user_id": user_id})
+        async for row in result.mappings():
+            yield dict(row)
     
-    async def get_due_habits(self, user_id: int, due_date: Optional[date] = None) -> List[Habit]:
-        """Get habits that are due on or before the specified date."""
+    async def stream_due_rows(
+        self, user_id: int, due_date: Optional[date] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream habits due on or before a date as plain column dicts."""
         if due_date is None:
             due_date = date.today()
         
-        statement = select(Habit).where(
-            Habit.user_id == user_id,
-            Habit.next_due_date <= due_date
+        result = await self.session.stream(
+            _DUE_HABIT_ROWS, {"user_id": user_id, "due_date": due_date}
         )
-        result = await self.session.execute(statement)
-        return list(result.scalars().all())
+        async for row in result.mappings():
+            yield dict(row)
     
-    async def update(self, habit: Habit, habit_data: HabitUpdate) -> Habit:
-        """Update a habit."""
-        update_data = habit_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(habit, field, value)
-        
-        self.session.add(habit)
-        await self.session.commit()
-        await self.session.refresh(habit)
-        return habit
+    async def update(self, habit_id: int, habit_data: HabitUpdate, user_id: int) -> Optional[Habit]:
+        """Update a habit, returning None if the user has no such habit."""
+        return await self._update_by_id(habit_id, user_id, habit_data)
     
-    async def delete(self, habit: Habit) -> None:
-        """Delete a habit."""
-        await self.session.delete(habit)
-        await self.session.commit()
+    async def delete(self, habit_id: int, user_id: int) -> bool:
+        """Delete a habit, returning False if the user has no such habit."""
+        return await self._delete_by_id(habit_id, user_id)
     
     async def complete_habit(self, habit: Habit, completion_date: Optional[date] = None) -> Habit:
         """Mark a habit as completed, update streak, and calculate next due date."""
         if completion_date is None:
             completion_date = date.today()
         
-        # Update streak count
-        habit.update_streak(completion_date)
+        # The streak check and the next due date share one interval lookup
+        interval = habit.recurrence_interval()
+        habit.update_streak(completion_date, interval)
         
         # Update completion date and calculate next due date
         habit.last_completed_date = completion_date
-        habit.next_due_date = habit.calculate_next_due_date(completion_date)
+        habit.next_due_date = completion_date + interval
         
         # Reset status to not started for the next occurrence
-        from app.models.enums import TaskStatus
         habit.status = TaskStatus.NOT_STARTED
         
-        self.session.add(habit)
-        await self.session.commit()
-        await self.session.refresh(habit)
-        return habit
\ No newline at end of file
+        return await self._save(habit)
\ No newline at end of file
@@ -1,22 +1,36 @@
 """
 Repository for Project CRUD operations.
 """
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
+from sqlalchemy import bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
-from app.models.project import Project, ProjectCreate, ProjectUpdate
+from app.models.project import Project, ProjectCreate, ProjectRead, ProjectUpdate
 from app.services.time_allocation import TimeAllocationService
-from app.core.exceptions import TimeAllocationExceeded
+from app.core.exceptions import ResourceNotFound, TimeAllocationExceeded
+from app.repositories.base import CrudRepository
 
+# Columns serialized by ProjectRead, selected directly for list reads
+_PROJECT_READ_COLUMNS = [getattr(Project, name) for name in ProjectRead.model_fields]
 
-class ProjectRepository:
+# Built once at import and executed with bound parameters
+_PROJECT_ROWS_FOR_USER = (
+    select(*_PROJECT_READ_COLUMNS)
+    .where(Project.user_id == bindparam("user_id"))
+    .order_by(Project.created_at.desc())
+)
+
+
+class ProjectRepository(CrudRepository[Project]):
     """Repository for Project CRUD operations."""
     
-    def __init__(self, session: AsyncSession):
-        self.session = session
-        self.time_service = TimeAllocationService(session)
+    model = Project
+    
+    def __init__(self, session: Optional[AsyncSession] = None):
+        super().__init__(session)
+        self.time_service = TimeAllocationService.for_session(self.session)
     
     async def create(self, project_data: ProjectCreate, user_id: int) -> Project:
         """
@@ -30,46 +44,28 @@ class ProjectRepository:
             Created project
         """
         project = Project(
-            **project_data.model_dump(),
+            **project_data.__dict__,
             user_id=user_id
         )
         
-        self.session.add(project)
-        await self.session.commit()
-        await self.session.refresh(project)
-        return project
+        return await self._save(project)
     
-    async def get_by_id(self, project_id: int, user_id: int) -> Optional[Project]:
+    async def stream_all_for_user_rows(self, user_id: int) -> AsyncIterator[Dict[str, Any]]:
         """
-        Get a project by ID for a specific user.
+        Stream all projects for a user as plain column dicts.
         
-        Args:
-            project_id: ID of the project
-            user_id: ID of the user
-            
-        Returns:
-            Project if found, None otherwise
-        """
-        statement = select(Project).where(
-            Project.id == project_id,
-            Project.user_id == user_id
-        )
-        result = await self.session.execute(statement)
-        return result.scalar_one_or_none()
-    
-    async def get_all_for_user(self, user_id: int) -> List[Project]:
-        """
-        Get all projects for a user.
+        Selects only the columns exposed by ProjectRead and yields rows as the
+        database returns them, without ORM instances or a full result list.
         
         Args:
             user_id: ID of the user
             
-        Returns:
-            List of projects
+        Yields:
+            Project column mappings
         """
-        statement = select(Project).where(Project.user_id == user_id).order_by(Project.created_at.desc())
-        result = await self.session.execute(statement)
-        return result.scalars().all()
+        result = await self.session.stream(_PROJECT_ROWS_FOR_USER, {"user_id": user_id})
+        async for row in result.mappings():
+            yield dict(row)
     
     async def update(self, project_id: int, project_data: ProjectUpdate, user_id: int) -> Optional[Project]:
         """
@@ -86,25 +82,18 @@ class ProjectRepository:
         Raises:
             TimeAllocationExceeded: If hours update would violate constraints
         """
-        # Get existing project
-        project = await self.get_by_id(project_id, user_id)
-        if not project:
-            return None
-        
-        # Validate hours update if provided
+        # Validate hours update if provided; only this needs an ownership check
+        # before the write, so other updates skip the extra lookup
         if project_data.weekly_hours is not None:
+            if not await self.get_by_id(project_id, user_id):
+                return None
+            
             await self.time_service.validate_project_hours_update(
                 project_id, project_data.weekly_hours
             )
         
-        # Update fields
-        update_data = project_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(project, field, value)
-        
-        await self.session.commit()
-        await self.session.refresh(project)
-        return project
+        # Write the changes and read the updated row back in one round trip
+        return await self._update_by_id(project_id, user_id, project_data)
     
     async def delete(self, project_id: int, user_id: int) -> bool:
         """
@@ -121,8 +110,7 @@ class ProjectRepository:
         if not project:
             return False
         
-        await self.session.delete(project)
-        await self.session.commit()
+        await self._remove(project)
         return True
     
     async def get_allocation_summary(self, project_id: int, user_id: int) -> Optional[dict]:
@@ -136,9 +124,8 @@ class ProjectRepository:
         Returns:
             Allocation summary if project found, None otherwise
         """
-        # Verify project belongs to user
-        project = await self.get_by_id(project_id, user_id)
-        if not project:
-            return None
-        
-        return await self.time_service.get_project_allocation_summary(project_id)
\ No newline at end of file
+        # Ownership is checked by the summary query itself
+        try:
+            return await self.time_service.get_project_allocation_summary(project_id, user_id)
+        except ResourceNotFound:
+            return None
\ No newline at end of file
@@ -1,21 +1,48 @@
 """
 Repository for Task CRUD operations.
 """
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
+from sqlalchemy import bindparam, literal_column
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
-from app.models.project import Task, TaskCreate, TaskUpdate, Goal
+from app.core.exceptions import ResourceNotFound
+from app.models.project import Task, TaskCreate, TaskRead, TaskUpdate, Goal
 from app.services.time_allocation import TimeAllocationService
+from app.repositories.base import CrudRepository
 
+# Columns serialized by TaskRead, selected directly for list reads
+_TASK_READ_COLUMNS = [getattr(Task, name) for name in TaskRead.model_fields]
 
-class TaskRepository:
+# Statements built once at import and executed with bound parameters
+_GOAL_OWNED = select(literal_column("1")).where(
+    Goal.id == bindparam("goal_id"),
+    Goal.user_id == bindparam("user_id")
+).limit(1)
+
+_TASK_ROWS_FOR_GOAL = (
+    select(*_TASK_READ_COLUMNS)
+    .join(Goal, Task.goal_id == Goal.id)
+    .where(Task.goal_id == bindparam("goal_id"), Goal.user_id == bindparam("user_id"))
+    .order_by(Task.created_at.desc())
+)
+
+_TASK_ROWS_FOR_USER = (
+    select(*_TASK_READ_COLUMNS)
+    .where(Task.user_id == bindparam("user_id"))
+    .order_by(Task.created_at.desc())
+)
+
+
+class TaskRepository(CrudRepository[Task]):
     """Repository for Task CRUD operations."""
     
-    def __init__(self, session: AsyncSession):
-        self.session = session
-        self.time_service = TimeAllocationService(session)
+    model = Task
+    
+    def __init__(self, session: Optional[AsyncSession] = None):
+        super().__init__(session)
+        self.time_service = TimeAllocationService.for_session(self.session)
     
     async def create(self, task_data: TaskCreate, goal_id: int, user_id: int) -> Task:
         """
@@ -30,19 +57,16 @@ class TaskRepository:
             Created task
             
         Raises:
-            ValueError: If goal not found or doesn't belong to user
-            TimeAllocationError: If hours would exceed goal allocation
+            ResourceNotFound: If goal not found or doesn't belong to user
+            TimeAllocationExceeded: If hours would exceed goal allocation
         """
-        # Verify goal exists and belongs to user
-        goal_stmt = select(Goal).where(
-            Goal.id == goal_id,
-            Goal.user_id == user_id
+        # Verify goal exists and belongs to user without loading the row
+        owned = await self.session.scalar(
+            _GOAL_OWNED, {"goal_id": goal_id, "user_id": user_id}
         )
-        goal_result = await self.session.execute(goal_stmt)
-        goal = goal_result.scalar_one_or_none()
         
-        if not goal:
-            raise ValueError(f"Goal with ID {goal_id} not found or access denied")
+        if owned is None:
+            raise ResourceNotFound("Goal", goal_id)
         
         # Validate time allocation
         await self.time_service.validate_task_hours_for_goal(
@@ -50,73 +74,50 @@ class TaskRepository:
         )
         
         task = Task(
-            **task_data.model_dump(),
+            **task_data.__dict__,
             goal_id=goal_id,
             user_id=user_id
         )
         
-        self.session.add(task)
-        await self.session.commit()
-        await self.session.refresh(task)
-        return task
+        return await self._save(task)
     
-    async def get_by_id(self, task_id: int, user_id: int) -> Optional[Task]:
+    async def stream_all_for_goal(self, goal_id: int, user_id: int) -> AsyncIterator[Dict[str, Any]]:
         """
-        Get a task by ID for a specific user.
+        Stream all tasks for a goal as plain column dicts.
         
-        Args:
-            task_id: ID of the task
-            user_id: ID of the user
-            
-        Returns:
-            Task if found, None otherwise
-        """
-        statement = select(Task).where(
-            Task.id == task_id,
-            Task.user_id == user_id
-        )
-        result = await self.session.execute(statement)
-        return result.scalar_one_or_none()
-    
-    async def get_all_for_goal(self, goal_id: int, user_id: int) -> List[Task]:
-        """
-        Get all tasks for a goal.
+        Selects only the columns exposed by TaskRead and yields rows as the
+        database returns them, without ORM instances or a full result list.
         
         Args:
             goal_id: ID of the goal
             user_id: ID of the user
             
-        Returns:
-            List of tasks
+        Yields:
+            Task column mappings
         """
-        # Verify goal belongs to user
-        goal_stmt = select(Goal).where(
-            Goal.id == goal_id,
-            Goal.user_id == user_id
+        # Ownership is checked in the same round trip via the join
+        result = await self.session.stream(
+            _TASK_ROWS_FOR_GOAL, {"goal_id": goal_id, "user_id": user_id}
         )
-        goal_result = await self.session.execute(goal_stmt)
-        goal = goal_result.scalar_one_or_none()
-        
-        if not goal:
-            return []
-        
-        statement = select(Task).where(Task.goal_id == goal_id).order_by(Task.created_at.desc())
-        result = await self.session.execute(statement)
-        return result.scalars().all()
+        async for row in result.mappings():
+            yield dict(row)
     
-    async def get_all_for_user(self, user_id: int) -> List[Task]:
+    async def stream_all_for_user_rows(self, user_id: int) -> AsyncIterator[Dict[str, Any]]:
         """
-        Get all tasks for a user.
+        Stream all tasks for a user as plain column dicts.
+        
+        Selects only the columns exposed by TaskRead and yields rows as the
+        database returns them, without ORM instances or a full result list.
         
         Args:
             user_id: ID of the user
             
-        Returns:
-            List of tasks
+        Yields:
+            Task column mappings
         """
-        statement = select(Task).where(Task.user_id == user_id).order_by(Task.created_at.desc())
-        result = await self.session.execute(statement)
-        return result.scalars().all()
+        result = await self.session.stream(_TASK_ROWS_FOR_USER, {"user_id": user_id})
+        async for row in result.mappings():
+            yield dict(row)
     
     async def update(self, task_id: int, task_data: TaskUpdate, user_id: int) -> Optional[Task]:
         """
@@ -133,25 +134,18 @@ class TaskRepository:
         Raises:
             TimeAllocationError: If hours update would violate constraints
         """
-        # Get existing task
-        task = await self.get_by_id(task_id, user_id)
-        if not task:
-            return None
-        
-        # Validate hours update if provided
+        # Validate hours update if provided; only this needs the current row
         if task_data.weekly_hours is not None:
+            task = await self.get_by_id(task_id, user_id)
+            if not task:
+                return None
+            
             await self.time_service.validate_task_hours_for_goal(
                 task.goal_id, task_data.weekly_hours, exclude_task_id=task_id
             )
         
-        # Update fields
-        update_data = task_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(task, field, value)
-        
-        await self.session.commit()
-        await self.session.refresh(task)
-        return task
+        # Write the changes and read the updated row back in one round trip
+        return await self._update_by_id(task_id, user_id, task_data)
     
     async def delete(self, task_id: int, user_id: int) -> bool:
         """
@@ -168,6 +162,5 @@ class TaskRepository:
         if not task:
             return False
         
-        await self.session.delete(task)
-        await self.session.commit()
+        await self._remove(task)
         return True
\ No newline at end of file
@@ -3,12 +3,71 @@ Time allocation service for validating hour constraints in the project hierarchy
 """
 from typing import List, Optional
 
+from sqlalchemy import bindparam, true
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select, func
 
 from app.models.project import Project, Goal, Task
 from app.core.exceptions import TimeAllocationExceeded, ResourceNotFound
 
+# Statements built once at import and executed with bound parameters.
+# A NULL exclude_* parameter excludes nothing (IS DISTINCT FROM NULL is true).
+_GOAL_HOURS_IN_PROJECT = (
+    select(func.coalesce(func.sum(Goal.weekly_hours), 0.0))
+    .where(Goal.project_id == bindparam("project_id"))
+)
+
+_TASK_HOURS_IN_GOAL = (
+    select(func.coalesce(func.sum(Task.weekly_hours), 0.0))
+    .where(Task.goal_id == bindparam("goal_id"))
+)
+
+_PROJECT_HOURS_AND_GOAL_HOURS = select(
+    Project.weekly_hours,
+    _GOAL_HOURS_IN_PROJECT
+    .where(Goal.id.is_distinct_from(bindparam("exclude_goal_id")))
+    .scalar_subquery()
+).where(Project.id == bindparam("project_id"))
+
+_GOAL_HOURS_AND_TASK_HOURS = select(
+    Goal.weekly_hours,
+    _TASK_HOURS_IN_GOAL
+    .where(Task.id.is_distinct_from(bindparam("exclude_task_id")))
+    .scalar_subquery()
+).where(Goal.id == bindparam("goal_id"))
+
+_GOAL_CHANGE_TOTALS = select(
+    Project.weekly_hours,
+    _GOAL_HOURS_IN_PROJECT.where(Goal.id != bindparam("goal_id")).scalar_subquery(),
+    _TASK_HOURS_IN_GOAL.scalar_subquery()
+).where(Project.id == bindparam("project_id"))
+
+_goal_totals = (
+    select(func.coalesce(func.sum(Goal.weekly_hours), 0.0), func.count(Goal.id))
+    .where(Goal.project_id == bindparam("project_id"))
+    .subquery()
+)
+_PROJECT_SUMMARY = (
+    select(Project.name, Project.weekly_hours, *_goal_totals.c)
+    .select_from(Project)
+    .join(_goal_totals, true())
+    .where(Project.id == bindparam("project_id"))
+)
+_OWNED_PROJECT_SUMMARY = _PROJECT_SUMMARY.where(Project.user_id == bindparam("user_id"))
+
+_task_totals = (
+    select(func.coalesce(func.sum(Task.weekly_hours), 0.0), func.count(Task.id))
+    .where(Task.goal_id == bindparam("goal_id"))
+    .subquery()
+)
+_GOAL_SUMMARY = (
+    select(Goal.name, Goal.project_id, Goal.weekly_hours, *_task_totals.c)
+    .select_from(Goal)
+    .join(_task_totals, true())
+    .where(Goal.id == bindparam("goal_id"))
+)
+_OWNED_GOAL_SUMMARY = _GOAL_SUMMARY.where(Goal.user_id == bindparam("user_id"))
+
 
 class TimeAllocationService:
     """Service for managing and validating time allocation constraints."""
@@ -16,6 +75,25 @@ class TimeAllocationService:
     def __init__(self, session: AsyncSession):
         self.session = session
     
+    @classmethod
+    def for_session(cls, session: AsyncSession) -> "TimeAllocationService":
+        """
+        Get the service shared by every repository using a session.
+        
+        The instance is stored in ``session.info``, so repositories built for
+        the same request reuse one service instead of creating their own.
+        
+        Args:
+            session: Database session
+            
+        Returns:
+            The session's TimeAllocationService
+        """
+        service = session.info.get(cls)
+        if service is None:
+            service = session.info[cls] = cls(session)
+        return service
+    
     async def validate_goal_hours_for_project(
         self, 
         project_id: int, 
@@ -33,29 +111,72 @@ class TimeAllocationService:
         Raises:
             TimeAllocationError: If the hours would exceed project allocation
         """
-        # Get project
-        project_stmt = select(Project).where(Project.id == project_id)
-        project_result = await self.session.execute(project_stmt)
-        project = project_result.scalar_one_or_none()
+        # Current goal hours (excluding the goal being updated if any), fetched
+        # with the project allocation in one round trip
+        result = await self.session.execute(
+            _PROJECT_HOURS_AND_GOAL_HOURS,
+            {"project_id": project_id, "exclude_goal_id": exclude_goal_id or None}
+        )
+        row = result.one_or_none()
         
-        if not project:
+        if row is None:
             raise ResourceNotFound("Project", project_id)
         
-        # Calculate current goal hours (excluding the goal being updated if any)
-        goals_stmt = select(func.sum(Goal.weekly_hours)).where(Goal.project_id == project_id)
-        if exclude_goal_id:
-            goals_stmt = goals_stmt.where(Goal.id != exclude_goal_id)
+        project_hours, current_goal_hours = row
+        self._check_goal_fits_project(
+            project_id, project_hours, current_goal_hours, new_goal_hours
+        )
+    
+    async def validate_goal_hours_change(
+        self,
+        goal_id: int,
+        project_id: int,
+        new_goal_hours: float
+    ) -> None:
+        """
+        Validate a goal's new hours against both its project and its tasks.
+        
+        The goal must still fit in its project and still cover its tasks'
+        hours. The project allocation, the sibling goal hours and the task
+        hours are fetched in a single query.
         
-        result = await self.session.execute(goals_stmt)
-        current_goal_hours = result.scalar() or 0.0
+        Args:
+            goal_id: ID of the goal being updated
+            project_id: ID of the goal's project
+            new_goal_hours: New hours for the goal
+            
+        Raises:
+            ResourceNotFound: If the project doesn't exist
+            TimeAllocationExceeded: If either constraint would be violated
+        """
+        result = await self.session.execute(
+            _GOAL_CHANGE_TOTALS, {"project_id": project_id, "goal_id": goal_id}
+        )
+        row = result.one_or_none()
+        
+        if row is None:
+            raise ResourceNotFound("Project", project_id)
         
-        # Check if adding new goal hours would exceed project allocation
+        project_hours, current_goal_hours, total_task_hours = row
+        self._check_goal_fits_project(
+            project_id, project_hours, current_goal_hours, new_goal_hours
+        )
+        self._check_goal_covers_tasks(total_task_hours, new_goal_hours)
+    
+    @staticmethod
+    def _check_goal_fits_project(
+        project_id: int,
+        project_hours: float,
+        current_goal_hours: float,
+        new_goal_hours: float
+    ) -> None:
+        """Raise if the goal hours would exceed the project allocation."""
         total_hours = current_goal_hours + new_goal_hours
-        if total_hours > project.weekly_hours:
-            available_hours = project.weekly_hours - current_goal_hours
+        if total_hours > project_hours:
+            available_hours = project_hours - current_goal_hours
             raise TimeAllocationExceeded(
                 f"Goal hours ({new_goal_hours}) would exceed project allocation. "
-                f"Project has {project.weekly_hours} hours total, "
+                f"Project has {project_hours} hours total, "
                 f"{current_goal_hours} already allocated to goals, "
                 f"only {available_hours} hours available.",
                 project_id=project_id,
@@ -64,6 +185,18 @@ class TimeAllocationService:
                 available_hours=available_hours
             )
     
+    @staticmethod
+    def _check_goal_covers_tasks(total_task_hours: float, new_goal_hours: float) -> None:
+        """Raise if the goal hours would drop below its allocated task hours."""
+        if new_goal_hours < total_task_hours:
+            raise TimeAllocationExceeded(
+                f"Cannot reduce goal hours to {new_goal_hours}. "
+                f"Tasks already allocated {total_task_hours} hours. "
+                f"Please reduce task allocations first.",
+                current_allocation=total_task_hours,
+                requested_hours=new_goal_hours
+            )
+    
     async def validate_task_hours_for_goal(
         self, 
         goal_id: int, 
@@ -81,29 +214,26 @@ class TimeAllocationService:
         Raises:
             TimeAllocationError: If the hours would exceed goal allocation
         """
-        # Get goal
-        goal_stmt = select(Goal).where(Goal.id == goal_id)
-        goal_result = await self.session.execute(goal_stmt)
-        goal = goal_result.scalar_one_or_none()
+        # Current task hours (excluding the task being updated if any), fetched
+        # with the goal allocation in one round trip
+        result = await self.session.execute(
+            _GOAL_HOURS_AND_TASK_HOURS,
+            {"goal_id": goal_id, "exclude_task_id": exclude_task_id or None}
+        )
+        row = result.one_or_none()
         
-        if not goal:
+        if row is None:
             raise ResourceNotFound("Goal", goal_id)
         
-        # Calculate current task hours (excluding the task being updated if any)
-        tasks_stmt = select(func.sum(Task.weekly_hours)).where(Task.goal_id == goal_id)
-        if exclude_task_id:
-            tasks_stmt = tasks_stmt.where(Task.id != exclude_task_id)
-        
-        result = await self.session.execute(tasks_stmt)
-        current_task_hours = result.scalar() or 0.0
+        goal_hours, current_task_hours = row
         
         # Check if adding new task hours would exceed goal allocation
         total_hours = current_task_hours + new_task_hours
-        if total_hours > goal.weekly_hours:
-            available_hours = goal.weekly_hours - current_task_hours
+        if total_hours > goal_hours:
+            available_hours = goal_hours - current_task_hours
             raise TimeAllocationExceeded(
                 f"Task hours ({new_task_hours}) would exceed goal allocation. "
-                f"Goal has {goal.weekly_hours} hours total, "
+                f"Goal has {goal_hours} hours total, "
                 f"{current_task_hours} already allocated to tasks, "
                 f"only {available_hours} hours available.",
                 goal_id=goal_id,
@@ -112,81 +242,89 @@ class TimeAllocationService:
                 available_hours=available_hours
             )
     
-    async def get_project_allocation_summary(self, project_id: int) -> dict:
+    async def get_project_allocation_summary(
+        self,
+        project_id: int,
+        user_id: Optional[int] = None
+    ) -> dict:
         """
         Get a summary of time allocation for a project.
         
         Args:
             project_id: ID of the project
+            user_id: If given, the project must also belong to this user
             
         Returns:
             Dictionary with allocation summary
+            
+        Raises:
+            ResourceNotFound: If the project doesn't exist or isn't the user's
         """
-        # Get project
-        project_stmt = select(Project).where(Project.id == project_id)
-        project_result = await self.session.execute(project_stmt)
-        project = project_result.scalar_one_or_none()
+        # Project, total goal hours and goal count in one round trip
+        if user_id is None:
+            result = await self.session.execute(_PROJECT_SUMMARY, {"project_id": project_id})
+        else:
+            result = await self.session.execute(
+                _OWNED_PROJECT_SUMMARY, {"project_id": project_id, "user_id": user_id}
+            )
+        row = result.one_or_none()
         
-        if not project:
+        if row is None:
             raise ResourceNotFound("Project", project_id)
         
-        # Get total goal hours
-        goals_stmt = select(func.sum(Goal.weekly_hours)).where(Goal.project_id == project_id)
-        goals_result = await self.session.execute(goals_stmt)
-        total_goal_hours = goals_result.scalar() or 0.0
-        
-        # Get goal count
-        goal_count_stmt = select(func.count(Goal.id)).where(Goal.project_id == project_id)
-        goal_count_result = await self.session.execute(goal_count_stmt)
-        goal_count = goal_count_result.scalar() or 0
+        project_name, project_hours, total_goal_hours, goal_count = row
         
         return {
             "project_id": project_id,
-            "project_name": project.name,
-            "total_hours": project.weekly_hours,
+            "project_name": project_name,
+            "total_hours": project_hours,
             "allocated_hours": total_goal_hours,
-            "available_hours": project.weekly_hours - total_goal_hours,
+            "available_hours": project_hours - total_goal_hours,
             "goal_count": goal_count,
-            "utilization_percentage": (total_goal_hours / project.weekly_hours) * 100 if project.weekly_hours > 0 else 0
+            "utilization_percentage": (total_goal_hours / project_hours) * 100 if project_hours > 0 else 0
         }
     
-    async def get_goal_allocation_summary(self, goal_id: int) -> dict:
+    async def get_goal_allocation_summary(
+        self,
+        goal_id: int,
+        user_id: Optional[int] = None
+    ) -> dict:
         """
         Get a summary of time allocation for a goal.
         
         Args:
             goal_id: ID of the goal
+            user_id: If given, the goal must also belong to this user
             
         Returns:
             Dictionary with allocation summary
+            
+        Raises:
+            ResourceNotFound: If the goal doesn't exist or isn't the user's
         """
-        # Get goal
-        goal_stmt = select(Goal).where(Goal.id == goal_id)
-        goal_result = await self.session.execute(goal_stmt)
-        goal = goal_result.scalar_one_or_none()
+        # Goal, total task hours and task count in one round trip
+        if user_id is None:
+            result = await self.session.execute(_GOAL_SUMMARY, {"goal_id": goal_id})
+        else:
+            result = await self.session.execute(
+                _OWNED_GOAL_SUMMARY, {"goal_id": goal_id, "user_id": user_id}
+            )
+        row = result.one_or_none()
         
-        if not goal:
+        if row is None:
             raise ResourceNotFound("Goal", goal_id)
         
-        # Get total task hours
-        tasks_stmt = select(func.sum(Task.weekly_hours)).where(Task.goal_id == goal_id)
-        tasks_result = await self.session.execute(tasks_stmt)
-        total_task_hours = tasks_result.scalar() or 0.0
-        
-        # Get task count
-        task_count_stmt = select(func.count(Task.id)).where(Task.goal_id == goal_id)
-        task_count_result = await self.session.execute(task_count_stmt)
-        task_count = task_count_result.scalar() or 0
+        goal_name, project_id, goal_hours, total_task_hours, task_count = row
         
         return {
             "goal_id": goal_id,
-            "goal_name": goal.name,
-            "project_id": goal.project_id,
-            "total_hours": goal.weekly_hours,
+            "goal_name": goal_name,
+            "project_id": project_id,
+            "total_hours": goal_hours,
             "allocated_hours": total_task_hours,
-            "available_hours": goal.weekly_hours - total_task_hours,
+            "available_hours": goal_hours - total_task_hours,
             "task_count": task_count,
-            "utilization_percentage": (total_task_hours / goal.weekly_hours) * 100 if goal.weekly_hours > 0 else 0
+            "utilization_percentage": (total_task_hours / goal_hours) * 100 if goal_hours > 0 else 0
         }
     
     async def validate_project_hours_update(
@@ -205,9 +343,9 @@ class TimeAllocationService:
             TimeAllocationError: If the new hours would be less than allocated goal hours
         """
         # Get total goal hours
-        goals_stmt = select(func.sum(Goal.weekly_hours)).where(Goal.project_id == project_id)
-        goals_result = await self.session.execute(goals_stmt)
-        total_goal_hours = goals_result.scalar() or 0.0
+        total_goal_hours = await self.session.scalar(
+            _GOAL_HOURS_IN_PROJECT, {"project_id": project_id}
+        )
         
         if new_project_hours < total_goal_hours:
             raise TimeAllocationExceeded(
@@ -217,32 +355,4 @@ class TimeAllocationService:
                 current_allocation=total_goal_hours,
                 requested_hours=new_project_hours
             )
-    
-    async def validate_goal_hours_update(
-        self, 
-        goal_id: int, 
-        new_goal_hours: float
-    ) -> None:
-        """
-        Validate that updating a goal's hours won't violate existing task allocations.
-        
-        Args:
-            goal_id: ID of the goal
-            new_goal_hours: New hours for the goal
-            
-        Raises:
-            TimeAllocationError: If the new hours would be less than allocated task hours
-        """
-        # Get total task hours
-        tasks_stmt = select(func.sum(Task.weekly_hours)).where(Task.goal_id == goal_id)
-        tasks_result = await self.session.execute(tasks_stmt)
-        total_task_hours = tasks_result.scalar() or 0.0
-        
-        if new_goal_hours < total_task_hours:
-            raise TimeAllocationExceeded(
-                f"Cannot reduce goal hours to {new_goal_hours}. "
-                f"Tasks already allocated {total_task_hours} hours. "
-                f"Please reduce task allocations first.",
-                current_allocation=total_task_hours,
-                requested_hours=new_goal_hours
-            )
\ No newline at end of file
+    
\ No newline at end of file
@@ -2,13 +2,18 @@
 Entry point for running the FastAPI application.
 """
 import uvicorn
-from app.main import app
+
+from app.core.config import settings
 
 if __name__ == "__main__":
+    # Auto-reload only supports a single process, so it is limited to DEBUG
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=settings.DEBUG,
+        workers=1 if settings.DEBUG else settings.WEB_CONCURRENCY,
+        loop="auto",
+        http="httptools",
         log_level="info"
-    )
\ No newline at end of file
+    )
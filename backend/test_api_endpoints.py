@@ -3,9 +3,22 @@
 Test script for recurring items API endpoints.
 """
 
-import requests
-import json
-from datetime import date, timedelta
+import asyncio
+
+import httpx
+
+
+async def fetch_all(base_url):
+    """Probe every endpoint concurrently; failed requests come back as exceptions."""
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        return await asyncio.gather(
+            client.get("/health"),
+            client.get("/chores/"),
+            client.get("/habits/"),
+            client.get("/docs"),
+            client.get("/openapi.json"),
+            return_exceptions=True,
+        )
 
 
 def test_api_endpoints():
@@ -14,24 +27,25 @@ def test_api_endpoints():
     
     print("🚀 Testing recurring items API endpoints...\n")
     
+    health, chores, habits, docs, spec = asyncio.run(fetch_all(base_url))
+    
     # Test health check first
-    try:
-        response = requests.get(f"{base_url}/health")
-        if response.status_code == 200:
-            print("✅ Server is running")
-        else:
-            print("❌ Server health check failed")
-            return False
-    except requests.exceptions.ConnectionError:
+    if isinstance(health, httpx.ConnectError):
         print("❌ Cannot connect to server. Make sure it's running on port 8000")
         return False
+    if isinstance(health, Exception) or health.status_code != 200:
+        print("❌ Server health check failed")
+        return False
+    print("✅ Server is running")
     
     # Test chores endpoints
     print("\n📝 Testing chores endpoints...")
     
     # Test GET /chores (should work without auth for now, or return 401)
     try:
-        response = requests.get(f"{base_url}/chores/")
+        response = chores
+        if isinstance(response, Exception):
+            raise response
         if response.status_code in [200, 401, 422]:  # 401 if auth required, 422 if validation error
             print(f"✅ GET /chores/ endpoint accessible (status: {response.status_code})")
         else:
@@ -43,7 +57,9 @@ def test_api_endpoints():
     print("\n🔥 Testing habits endpoints...")
     
     try:
-        response = requests.get(f"{base_url}/habits/")
+        response = habits
+        if isinstance(response, Exception):
+            raise response
         if response.status_code in [200, 401, 422]:  # 401 if auth required, 422 if validation error
             print(f"✅ GET /habits/ endpoint accessible (status: {response.status_code})")
         else:
@@ -55,7 +71,9 @@ def test_api_endpoints():
     print("\n📚 Testing API documentation...")
     
     try:
-        response = requests.get(f"{base_url}/docs")
+        response = docs
+        if isinstance(response, Exception):
+            raise response
         if response.status_code == 200:
             print("✅ API documentation accessible at /docs")
         else:
@@ -65,7 +83,9 @@ def test_api_endpoints():
     
     # Test OpenAPI schema
     try:
-        response = requests.get(f"{base_url}/openapi.json")
+        response = spec
+        if isinstance(response, Exception):
+            raise response
         if response.status_code == 200:
             openapi_spec = response.json()
             
@@ -167,7 +167,7 @@ class ProjectHierarchyTester:
             created_goals = []
             for goal_data in goals_data:
                 response = await self.client.post(
-                    f"/goals/projects/{self.test_data['project_id']}/goals",
+                    f"/projects/{self.test_data['project_id']}/goals",
                     json=goal_data,
                     headers=self._get_auth_headers()
                 )
@@ -259,7 +259,7 @@ class ProjectHierarchyTester:
             for goal_id, tasks in all_tasks:
                 for task_data in tasks:
                     response = await self.client.post(
-                        f"/tasks/goals/{goal_id}/tasks",
+                        f"/goals/{goal_id}/tasks",
                         json=task_data,
                         headers=self._get_auth_headers()
                     )
@@ -303,7 +303,7 @@ class ProjectHierarchyTester:
                 }
                 
                 response = await self.client.post(
-                    f"/goals/projects/{self.test_data['project_id']}/goals",
+                    f"/projects/{self.test_data['project_id']}/goals",
                     json=excess_goal_data,
                     headers=self._get_auth_headers()
                 )
@@ -336,7 +336,7 @@ class ProjectHierarchyTester:
                 }
                 
                 response = await self.client.post(
-                    f"/tasks/goals/{self.test_data['goal_ids'][0]}/tasks",
+                    f"/goals/{self.test_data['goal_ids'][0]}/tasks",
                     json=excess_task_data,
                     headers=self._get_auth_headers()
                 )
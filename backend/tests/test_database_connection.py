@@ -5,8 +5,8 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import SQLModel, Field
 
-from app.core.config import settings
-from app.core.database import engine, get_session, init_db, close_db
+from app.core.config import get_settings, settings
+from app.core.database import engine, get_session, init_db, close_db, warm_pool
 from app.core.database_utils import (
     create_database_if_not_exists,
     drop_database_if_exists,
@@ -58,6 +58,13 @@ class TestDatabaseConnection:
         # This should not raise an exception
         await init_db()
 
+    @pytest.mark.asyncio
+    async def test_warm_pool(self):
+        """Test that warming opens only the configured number of connections."""
+        await warm_pool()
+
+        assert engine.pool.checkedin() >= min(settings.DB_POOL_WARM_SIZE, settings.DB_POOL_SIZE)
+
     @pytest.mark.asyncio
     async def test_close_db(self):
         """Test database connection closing."""
@@ -139,6 +146,11 @@ class TestConfigurationLoading:
         """Test that production and test database URLs are different."""
         assert settings.DATABASE_URL != settings.TEST_DATABASE_URL
 
+    def test_settings_are_cached(self):
+        """Test that settings are built once and hosts parsed up front."""
+        assert get_settings() is settings
+        assert isinstance(settings.ALLOWED_HOSTS, tuple)
+
     def test_debug_setting(self):
         """Test debug setting."""
         assert isinstance(settings.DEBUG, bool)
\ No newline at end of file
@@ -2,6 +2,8 @@
 Tests for the main FastAPI application.
 """
 import pytest
+from fastapi.dependencies.utils import is_coroutine_callable
+from fastapi.routing import APIRoute
 from httpx import AsyncClient, ASGITransport
 
 from app.main import app, create_app
@@ -23,6 +25,20 @@ class TestApplication:
         assert app.title == "Productivity Management System"
         assert app.version == "1.0.0"
 
+    def test_routes_avoid_threadpool_dispatch(self) -> None:
+        """Test that every endpoint and dependency is awaited directly."""
+        def walk(dependant):
+            for sub in dependant.dependencies:
+                yield sub
+                yield from walk(sub)
+
+        for route in app.routes:
+            if not isinstance(route, APIRoute):
+                continue
+            assert is_coroutine_callable(route.endpoint), route.path
+            for dependency in walk(route.dependant):
+                assert is_coroutine_callable(dependency.call), (route.path, dependency.call)
+
     @pytest.mark.asyncio
     async def test_root_endpoint(self) -> None:
         """Test the root endpoint returns expected response."""
@@ -78,4 +94,12 @@ class TestApplication:
             assert response.status_code == 200
             data = response.json()
             assert data["info"]["title"] == "Productivity Management System"
-            assert data["info"]["version"] == "1.0.0"
\ No newline at end of file
+            assert data["info"]["version"] == "1.0.0"
+
+    def test_protected_routes_declare_bearer_auth(self) -> None:
+        """Test that authenticated routes advertise the bearer scheme in OpenAPI."""
+        schema = app.openapi()
+
+        assert schema["components"]["securitySchemes"]["HTTPBearer"]["scheme"] == "bearer"
+        assert schema["paths"]["/projects/"]["get"]["security"] == [{"HTTPBearer": []}]
+        assert "security" not in schema["paths"]["/auth/login"]["post"]
@@ -12,8 +12,10 @@ from app.models.base import (
     BaseNamedModel,
     BaseUserOwnedModel,
     BaseUserOwnedNamedModel,
+    ReadModel,
     TimestampMixin,
 )
+from app.models.recurring import Chore
 
 
 class TestTimestampMixin:
@@ -46,6 +48,11 @@ class TestTimestampMixin:
         after = datetime.utcnow()
         
         assert before <= model.created_at <= after
+    
+    def test_updated_at_stamped_on_update(self):
+        """Test that UPDATE statements set updated_at automatically."""
+        assert Chore.__table__.c.updated_at.onupdate is not None
+        assert "updated_at" in str(Chore.__table__.update().values(name="x"))
 
 
 class TestBaseModel:
@@ -158,4 +165,37 @@ class TestBaseUserOwnedNamedModel:
         
         assert model.user_id == 1
         assert model.name == "Test Name"
-        assert model.description is None
\ No newline at end of file
+        assert model.description is None
+
+
+class TestReadModel:
+    """Test ReadModel functionality."""
+    
+    def test_field_names_cached_per_subclass(self):
+        """Test that each subclass records its own field names."""
+        
+        class ItemRead(ReadModel):
+            id: int
+            name: str
+        
+        assert ItemRead._field_names == ("id", "name")
+        assert ReadModel._field_names == ()
+    
+    def test_from_orm_fast_copies_attributes(self):
+        """Test that from_orm_fast copies declared fields from an object."""
+        
+        class ItemRead(ReadModel):
+            id: int
+            name: str
+            description: Optional[str]
+        
+        class Row:
+            id = 1
+            name = "Item"
+            description = None
+            secret = "not exposed"
+        
+        item = ItemRead.from_orm_fast(Row())
+        
+        assert isinstance(item, ItemRead)
+        assert item.model_dump() == {"id": 1, "name": "Item", "description": None}
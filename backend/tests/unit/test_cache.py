@@ -0,0 +1,50 @@
+"""
+Unit tests for in-process caching utilities.
+"""
+from unittest.mock import patch
+
+from app.core.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test TTLCache."""
+
+    def test_set_and_get(self):
+        """Test storing and reading a value."""
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+    def test_missing_key(self):
+        """Test that a missing key returns None."""
+        cache = TTLCache(maxsize=2, ttl=30)
+        assert cache.get("missing") is None
+
+    def test_entry_expires(self):
+        """Test that entries are dropped once their TTL passes."""
+        cache = TTLCache(maxsize=2, ttl=30)
+        with patch("app.core.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("app.core.cache.time.monotonic", return_value=131.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_pop(self):
+        """Test invalidating a single entry."""
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache.set("a", 1)
+        cache.pop("a")
+        cache.pop("missing")
+        assert cache.get("a") is None
@@ -0,0 +1,70 @@
+"""
+Unit tests for database administration helpers.
+"""
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.core.database_utils import (
+    create_database_if_not_exists,
+    drop_database_if_exists,
+)
+
+
+class TestCreateDatabaseIfNotExists:
+    """Test create_database_if_not_exists."""
+
+    @pytest.fixture
+    def mock_conn(self):
+        """Mock asyncpg connection."""
+        return AsyncMock()
+
+    @pytest.mark.asyncio
+    async def test_creates_missing_database(self, mock_conn):
+        """Test that a missing database is created with a quoted name."""
+        mock_conn.fetchval.return_value = None
+
+        with patch("app.core.database_utils.asyncpg.connect", return_value=mock_conn) as mock_connect:
+            await create_database_if_not_exists("postgresql+asyncpg://u:p@localhost/life_test")
+
+        mock_connect.assert_awaited_once_with("postgresql://u:p@localhost/postgres")
+        mock_conn.fetchval.assert_awaited_once_with(
+            "SELECT 1 FROM pg_database WHERE datname = $1", "life_test"
+        )
+        mock_conn.execute.assert_awaited_once_with('CREATE DATABASE "life_test"')
+        mock_conn.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_existing_database_is_left_alone(self, mock_conn):
+        """Test that an existing database is not recreated."""
+        mock_conn.fetchval.return_value = 1
+
+        with patch("app.core.database_utils.asyncpg.connect", return_value=mock_conn):
+            await create_database_if_not_exists("postgresql://u:p@localhost/life_test")
+
+        mock_conn.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rejects_unsafe_name(self):
+        """Test that names outside [A-Za-z0-9_] are rejected before connecting."""
+        with patch("app.core.database_utils.asyncpg.connect") as mock_connect:
+            with pytest.raises(ValueError):
+                await create_database_if_not_exists('postgresql://u:p@localhost/x"; DROP TABLE user; --')
+
+        mock_connect.assert_not_called()
+
+
+class TestDropDatabaseIfExists:
+    """Test drop_database_if_exists."""
+
+    @pytest.mark.asyncio
+    async def test_drops_database(self):
+        """Test that connections are terminated and the database dropped."""
+        mock_conn = AsyncMock()
+
+        with patch("app.core.database_utils.asyncpg.connect", return_value=mock_conn):
+            await drop_database_if_exists("postgresql://u:p@localhost/life_test")
+
+        terminate_call, drop_call = mock_conn.execute.await_args_list
+        assert terminate_call.args[1] == "life_test"
+        assert drop_call.args == ('DROP DATABASE IF EXISTS "life_test"',)
+        mock_conn.close.assert_awaited_once()
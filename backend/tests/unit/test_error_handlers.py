@@ -0,0 +1,111 @@
+"""
+Unit tests for the exception handlers.
+"""
+import json
+
+import pytest
+from fastapi.exceptions import RequestValidationError
+from sqlalchemy.exc import IntegrityError
+from starlette.requests import Request
+
+from app.core.error_handlers import (
+    database_error_handler,
+    productivity_system_exception_handler,
+    validation_error_handler,
+)
+from app.core.exceptions import ProductivitySystemException, ResourceNotFound
+
+
+class FakeDBAPIError(Exception):
+    """DBAPI error carrying a SQLSTATE, as raised by the asyncpg adapter."""
+
+    def __init__(self, message, sqlstate):
+        super().__init__(message)
+        self.sqlstate = sqlstate
+
+
+def make_request():
+    """Build a minimal request."""
+    return Request({"type": "http", "method": "POST", "path": "/goals", "headers": [],
+                    "query_string": b"", "server": ("test", 80), "scheme": "http"})
+
+
+@pytest.mark.asyncio
+async def test_check_violation_is_time_allocation_error():
+    """Test that over-allocation caught by the hours triggers returns 422."""
+    exc = IntegrityError("COMMIT", {}, FakeDBAPIError("Goal hours exceed", "23514"))
+
+    response = await database_error_handler(make_request(), exc)
+
+    assert response.status_code == 422
+    assert json.loads(response.body)["error"]["code"] == "TIME_ALLOCATION_EXCEEDED"
+
+
+@pytest.mark.asyncio
+async def test_unique_violation_is_bad_request():
+    """Test that other integrity errors keep their 400 response."""
+    exc = IntegrityError(
+        "INSERT", {}, FakeDBAPIError("duplicate key value violates unique constraint", "23505")
+    )
+
+    response = await database_error_handler(make_request(), exc)
+
+    assert response.status_code == 400
+    assert json.loads(response.body)["error"]["message"] == "Duplicate entry - this value already exists"
+
+
+@pytest.mark.asyncio
+async def test_not_null_violation_message():
+    """Test that PostgreSQL's not-null wording is classified."""
+    exc = IntegrityError(
+        "INSERT", {}, FakeDBAPIError('null value in column "name" violates not-null constraint', "23502")
+    )
+
+    response = await database_error_handler(make_request(), exc)
+
+    assert json.loads(response.body)["error"]["message"] == "Required field cannot be empty"
+
+
+@pytest.mark.asyncio
+async def test_known_exception_maps_to_status_and_code():
+    """Test that known exception classes get their status and error code."""
+    response = await productivity_system_exception_handler(make_request(), ResourceNotFound("Goal", 1))
+
+    assert response.status_code == 404
+    assert json.loads(response.body)["error"]["code"] == "RESOURCENOTFOUND"
+
+
+@pytest.mark.asyncio
+async def test_unknown_exception_falls_back_to_500():
+    """Test that unmapped subclasses get a 500 and their own class name as code."""
+    class Unmapped(ProductivitySystemException):
+        pass
+
+    response = await productivity_system_exception_handler(make_request(), Unmapped("boom"))
+
+    assert response.status_code == 500
+    assert json.loads(response.body)["error"]["code"] == "UNMAPPED"
+
+
+@pytest.mark.asyncio
+async def test_validation_errors_are_flattened():
+    """Test that pydantic errors become field/message/type entries."""
+    exc = RequestValidationError([
+        {"loc": ("body", "weekly_hours"), "msg": "Input should be greater than 0", "type": "greater_than"}
+    ])
+
+    response = await validation_error_handler(make_request(), exc)
+
+    assert response.status_code == 422
+    assert json.loads(response.body)["error"]["details"]["errors"] == [
+        {"field": "body -> weekly_hours", "message": "Input should be greater than 0", "type": "greater_than"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_request_url_is_logged_lazily(caplog):
+    """Test that the logged request URL still renders when the record is formatted."""
+    with caplog.at_level("INFO", logger="app.core.error_handlers"):
+        await productivity_system_exception_handler(make_request(), ResourceNotFound("Goal", 1))
+
+    assert str(caplog.records[0].request_url) == "http://test/goals"
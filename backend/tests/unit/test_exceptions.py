@@ -0,0 +1,67 @@
+"""
+Unit tests for the custom exception hierarchy.
+"""
+from app.core.exceptions import (
+    MAX_REFLECTED_VALUE_LENGTH,
+    DatabaseError,
+    ResourceNotFound,
+    TimeAllocationExceeded,
+    ValidationError,
+)
+
+
+class TestDefaultMessages:
+    """Test lazily formatted default messages."""
+
+    def test_default_message_formatted_from_details(self):
+        """Test that the default message is built from the details on access."""
+        exc = ResourceNotFound("Goal", 7)
+
+        assert exc.message == "Goal with ID 7 not found"
+        assert str(exc) == exc.message
+
+    def test_explicit_message_wins(self):
+        """Test that a caller-supplied message is used as-is."""
+        exc = ResourceNotFound("Goal", 7, message="No such goal")
+
+        assert exc.message == "No such goal"
+        assert exc.details == {"resource_type": "Goal", "resource_id": 7}
+
+    def test_caller_details_are_not_mutated(self):
+        """Test that extra details are merged into a new mapping."""
+        extra = {"hint": "check the ID"}
+
+        exc = DatabaseError("insert", details=extra)
+
+        assert extra == {"hint": "check the ID"}
+        assert exc.details == {"hint": "check the ID", "operation": "insert"}
+        assert exc.message == "Database error during insert"
+
+    def test_missing_details_are_empty(self):
+        """Test that exceptions without details expose an empty mapping."""
+        exc = TimeAllocationExceeded("Too many hours")
+
+        assert exc.details == {}
+        assert str(exc) == "Too many hours"
+
+
+class TestValidationErrorValue:
+    """Test the size bound on reflected validation values."""
+
+    def test_small_values_pass_through(self):
+        """Test that short strings and numbers are kept as-is."""
+        assert ValidationError("name", "Gym", "too short").details["value"] == "Gym"
+        assert ValidationError("hours", 200, "max 168").details["value"] == 200
+
+    def test_long_string_is_truncated(self):
+        """Test that oversized strings are cut to the limit."""
+        value = ValidationError("description", "x" * 10_000, "too long").details["value"]
+
+        assert value == "x" * MAX_REFLECTED_VALUE_LENGTH + "…"
+
+    def test_large_container_is_summarized(self):
+        """Test that containers are replaced by a bounded repr."""
+        value = ValidationError("tags", list(range(10_000)), "too many").details["value"]
+
+        assert isinstance(value, str)
+        assert len(value) < MAX_REFLECTED_VALUE_LENGTH
@@ -0,0 +1,139 @@
+"""
+Unit tests for the authentication/session ASGI middleware.
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core.database import get_request_session
+from app.core.middleware import AuthSessionMiddleware, get_bearer_token, user_cache
+from app.core.security import create_access_token
+from app.models.user import User
+
+
+def make_scope(headers=None, scope_type="http"):
+    """Build a minimal ASGI scope."""
+    return {"type": scope_type, "headers": headers or []}
+
+
+class TestGetBearerToken:
+    """Test bearer token extraction from raw headers."""
+
+    def test_bearer_token(self):
+        """Test extracting a bearer token."""
+        scope = make_scope([(b"authorization", b"Bearer abc.def.ghi")])
+        assert get_bearer_token(scope) == "abc.def.ghi"
+
+    def test_scheme_is_case_insensitive(self):
+        """Test that the scheme comparison ignores case."""
+        scope = make_scope([(b"authorization", b"bearer abc")])
+        assert get_bearer_token(scope) == "abc"
+
+    def test_missing_header(self):
+        """Test that no header yields None."""
+        assert get_bearer_token(make_scope()) is None
+
+    def test_other_scheme(self):
+        """Test that non-bearer schemes are ignored."""
+        scope = make_scope([(b"authorization", b"Basic dXNlcjpwYXNz")])
+        assert get_bearer_token(scope) is None
+
+
+class TestAuthSessionMiddleware:
+    """Test AuthSessionMiddleware."""
+
+    @pytest.fixture
+    def mock_user(self):
+        """Mock user object."""
+        return User(
+            id=1,
+            username="testuser",
+            email="test@example.com",
+            hashed_password="hashed_password",
+            is_active=True
+        )
+
+    @pytest.fixture(autouse=True)
+    def clear_user_cache(self):
+        """Start every test with an empty user cache."""
+        user_cache.clear()
+        yield
+        user_cache.clear()
+
+    @pytest.fixture
+    def mock_session(self, mock_user):
+        """Mock database session returning mock_user."""
+        session = AsyncMock()
+        session.scalar.return_value = mock_user
+        return session
+
+    @pytest.fixture
+    def session_factory(self, mock_session):
+        """Mock session factory usable as an async context manager."""
+        context = AsyncMock()
+        context.__aenter__.return_value = mock_session
+        return MagicMock(return_value=context)
+
+    @pytest.mark.asyncio
+    async def test_attaches_user_and_session(self, session_factory, mock_session, mock_user):
+        """Test that a valid token attaches the user and binds the session."""
+        seen_sessions = []
+
+        async def inner(scope, receive, send):
+            seen_sessions.append(get_request_session())
+
+        token = create_access_token("1")
+        scope = make_scope([(b"authorization", f"Bearer {token}".encode())])
+
+        with patch("app.core.middleware.AsyncSessionLocal", session_factory):
+            await AuthSessionMiddleware(inner)(scope, AsyncMock(), AsyncMock())
+
+        assert seen_sessions == [mock_session]
+        assert scope["state"]["user"].id == mock_user.id
+        assert scope["state"]["user"].username == mock_user.username
+
+    @pytest.mark.asyncio
+    async def test_repeat_user_served_from_cache(self, session_factory, mock_session):
+        """Test that a second request for the same user skips the database."""
+        token = create_access_token("1")
+        headers = [(b"authorization", f"Bearer {token}".encode())]
+
+        with patch("app.core.middleware.AsyncSessionLocal", session_factory):
+            for _ in range(2):
+                await AuthSessionMiddleware(AsyncMock())(
+                    make_scope(headers), AsyncMock(), AsyncMock()
+                )
+
+        mock_session.scalar.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_anonymous_request(self, session_factory, mock_session):
+        """Test that requests without a token get no user and skip the query."""
+        inner = AsyncMock()
+        scope = make_scope()
+
+        with patch("app.core.middleware.AsyncSessionLocal", session_factory):
+            await AuthSessionMiddleware(inner)(scope, AsyncMock(), AsyncMock())
+
+        assert scope["state"]["user"] is None
+        mock_session.scalar.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_non_http_scope_passthrough(self, session_factory):
+        """Test that non-HTTP scopes bypass the middleware."""
+        inner = AsyncMock()
+        scope = make_scope(scope_type="lifespan")
+
+        with patch("app.core.middleware.AsyncSessionLocal", session_factory):
+            await AuthSessionMiddleware(inner)(scope, AsyncMock(), AsyncMock())
+
+        inner.assert_awaited_once()
+        session_factory.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_session_unbound_after_request(self, session_factory):
+        """Test that the request session is unbound once the request ends."""
+        with patch("app.core.middleware.AsyncSessionLocal", session_factory):
+            await AuthSessionMiddleware(AsyncMock())(make_scope(), AsyncMock(), AsyncMock())
+
+        with pytest.raises(LookupError):
+            get_request_session()
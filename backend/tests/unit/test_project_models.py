@@ -0,0 +1,81 @@
+"""
+Unit tests for Project, Goal, and Task schemas.
+"""
+from datetime import date, datetime
+
+import pytest
+from pydantic import ValidationError
+
+from app.models.project import GoalCreate, ProjectCreate, ProjectUpdate, TaskCreate
+
+
+def project_data(**overrides):
+    """Build valid ProjectCreate data with optional overrides."""
+    data = {
+        "name": "Test Project",
+        "weekly_hours": 10.0,
+        "start_date": date(2024, 1, 1),
+        "color": "#FF5733",
+    }
+    data.update(overrides)
+    return data
+
+
+class TestHexColor:
+    """Test hex color validation on project schemas."""
+    
+    @pytest.mark.parametrize("color", ["#FF5733", "#abcdef", "#000000"])
+    def test_valid_colors(self, color):
+        """Test that #RRGGBB codes are accepted."""
+        assert ProjectCreate(**project_data(color=color)).color == color
+    
+    @pytest.mark.parametrize("color", ["FF5733", "#FFF", "#GG5733", "#FF5733\n", "red"])
+    def test_invalid_colors(self, color):
+        """Test that anything but #RRGGBB is rejected."""
+        with pytest.raises(ValidationError):
+            ProjectCreate(**project_data(color=color))
+    
+    def test_update_color_optional(self):
+        """Test that updates may omit the color but still validate it."""
+        assert ProjectUpdate().color is None
+        
+        with pytest.raises(ValidationError):
+            ProjectUpdate(color="#12345")
+    
+    def test_json_schema_keeps_pattern(self):
+        """Test that the OpenAPI schema still documents the pattern."""
+        schema = ProjectCreate.model_json_schema()
+        assert schema["properties"]["color"]["pattern"] == "^#[0-9A-Fa-f]{6}$"
+
+
+class TestDateRanges:
+    """Test end-after-start validation on create schemas."""
+    
+    def test_end_date_after_start_date(self):
+        """Test that a later end date is accepted."""
+        project = ProjectCreate(**project_data(end_date=date(2024, 2, 1)))
+        assert project.end_date == date(2024, 2, 1)
+    
+    @pytest.mark.parametrize("end_date", [date(2024, 1, 1), date(2023, 12, 31)])
+    def test_end_date_not_after_start_date(self, end_date):
+        """Test that an end date on or before the start date is rejected."""
+        with pytest.raises(ValidationError, match="End date must be after start date"):
+            ProjectCreate(**project_data(end_date=end_date))
+        
+        with pytest.raises(ValidationError, match="End date must be after start date"):
+            GoalCreate(name="Goal", weekly_hours=5.0, start_date=date(2024, 1, 1), end_date=end_date)
+    
+    def test_end_time_requires_start_time_to_compare(self):
+        """Test that end_time is only checked when start_time is set."""
+        task = TaskCreate(name="Task", weekly_hours=2.0, end_time=datetime(2024, 1, 1, 9))
+        assert task.start_time is None
+    
+    def test_end_time_not_after_start_time(self):
+        """Test that an end time on or before the start time is rejected."""
+        with pytest.raises(ValidationError, match="End time must be after start time"):
+            TaskCreate(
+                name="Task",
+                weekly_hours=2.0,
+                start_time=datetime(2024, 1, 1, 9),
+                end_time=datetime(2024, 1, 1, 9),
+            )
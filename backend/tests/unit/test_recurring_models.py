@@ -0,0 +1,92 @@
+"""
+Unit tests for Chore and Habit schemas.
+"""
+from datetime import date, datetime
+
+import pytest
+from pydantic import ValidationError
+
+from app.models.enums import FrequencyType
+from app.models.recurring import Chore, ChoreCreate, Habit, HabitCreate
+
+
+def recurring_data(**overrides):
+    """Build valid recurring item data with optional overrides."""
+    data = {
+        "name": "Laundry",
+        "frequency_type": "weekly",
+        "next_due_date": date(2024, 1, 1),
+    }
+    data.update(overrides)
+    return data
+
+
+@pytest.mark.parametrize("schema", [ChoreCreate, HabitCreate])
+class TestRecurringSchedule:
+    """Test the shared schedule validation."""
+
+    def test_valid_schedule(self, schema):
+        """Test that a consistent schedule is accepted."""
+        item = schema(**recurring_data(frequency_type="custom", frequency_value=3))
+        assert item.frequency_value == 3
+
+    def test_frequency_value_requires_custom(self, schema):
+        """Test that non-custom frequencies only allow a value of 1."""
+        with pytest.raises(ValidationError, match="Frequency value must be 1"):
+            schema(**recurring_data(frequency_value=2))
+
+    def test_end_time_not_after_start_time(self, schema):
+        """Test that an end time on or before the start time is rejected."""
+        with pytest.raises(ValidationError, match="End time must be after start time"):
+            schema(**recurring_data(
+                start_time=datetime(2024, 1, 1, 9),
+                end_time=datetime(2024, 1, 1, 8),
+            ))
+
+
+class TestCalculateNextDueDate:
+    """Test next due date calculation."""
+
+    @pytest.mark.parametrize("frequency_type, frequency_value, expected", [
+        (FrequencyType.DAILY, 1, date(2024, 1, 2)),
+        (FrequencyType.WEEKLY, 1, date(2024, 1, 8)),
+        (FrequencyType.BIWEEKLY, 1, date(2024, 1, 15)),
+        (FrequencyType.MONTHLY, 1, date(2024, 1, 31)),
+        (FrequencyType.CUSTOM, 3, date(2024, 1, 4)),
+    ])
+    def test_interval_per_frequency(self, frequency_type, frequency_value, expected):
+        """Test that each frequency advances by its interval."""
+        chore = Chore(name="Laundry", user_id=1, frequency_type=frequency_type,
+                      frequency_value=frequency_value, next_due_date=date(2024, 1, 1))
+
+        assert chore.calculate_next_due_date(date(2024, 1, 1)) == expected
+
+
+class TestUpdateStreak:
+    """Test habit streak tracking."""
+
+    def make_habit(self, **overrides):
+        """Build a weekly habit last completed on 2024-01-01."""
+        data = {"name": "Run", "user_id": 1, "frequency_type": FrequencyType.WEEKLY,
+                "next_due_date": date(2024, 1, 8), "last_completed_date": date(2024, 1, 1),
+                "streak_count": 3}
+        data.update(overrides)
+        return Habit(**data)
+
+    def test_completion_within_interval_extends_streak(self):
+        """Test that completing by the expected date extends the streak."""
+        habit = self.make_habit()
+
+        assert habit.update_streak(date(2024, 1, 8), habit.recurrence_interval()) == 4
+
+    def test_late_completion_resets_streak(self):
+        """Test that completing after the expected date restarts the streak."""
+        assert self.make_habit().update_streak(date(2024, 1, 9)) == 1
+
+    def test_daily_streak_across_month_boundary(self):
+        """Test that daily streaks count consecutive days across months."""
+        habit = self.make_habit(frequency_type=FrequencyType.DAILY,
+                                last_completed_date=date(2024, 1, 31))
+
+        assert habit.update_streak(date(2024, 2, 1)) == 4
+        assert habit.update_streak(date(2024, 2, 5)) == 1
@@ -0,0 +1,92 @@
+"""
+Unit tests for the shared repository base class.
+"""
+import pytest
+from datetime import date
+from unittest.mock import AsyncMock
+
+from app.models.enums import FrequencyType
+from app.models.project import ProjectUpdate
+from app.models.recurring import Chore, ChoreUpdate, Habit
+from app.repositories import ChoreRepository, HabitRepository
+from app.repositories.base import select_for_user
+from app.repositories.project import ProjectRepository
+
+
+def make_chore(user_id):
+    """Build a chore owned by the given user."""
+    return Chore(id=1, name="Dishes", frequency_type=FrequencyType.DAILY,
+                 next_due_date=date(2024, 1, 1), user_id=user_id)
+
+
+class TestCrudRepository:
+    """Test behaviour shared through CrudRepository."""
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_checks_owner(self):
+        """Test that rows owned by another user are not returned."""
+        session = AsyncMock()
+        session.get.return_value = make_chore(user_id=1)
+        repository = ChoreRepository(session)
+
+        assert (await repository.get_by_id(1, 1)).id == 1
+        assert await repository.get_by_id(1, 2) is None
+        session.get.assert_awaited_with(Chore, 1)
+
+    @pytest.mark.asyncio
+    async def test_delete_is_one_statement(self):
+        """Test that deleting by ID issues a single owner-filtered DELETE."""
+        session = AsyncMock()
+        session.scalar.side_effect = [1, None]
+        repository = ChoreRepository(session)
+
+        assert await repository.delete(1, 1) is True
+        assert await repository.delete(1, 2) is False
+
+        statement = session.scalar.await_args.args[0]
+        assert "DELETE FROM chore" in str(statement)
+        assert "chore.user_id" in str(statement)
+        assert session.scalar.await_count == 2
+        assert session.commit.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_update_is_one_statement(self):
+        """Test that updating by ID writes only the set fields with RETURNING."""
+        chore = make_chore(user_id=1)
+        session = AsyncMock()
+        session.scalar.return_value = chore
+        repository = ChoreRepository(session)
+
+        updated = await repository.update(1, ChoreUpdate(name="Laundry"), 1)
+
+        assert updated is chore
+        statement = session.scalar.await_args.args[0]
+        assert str(statement).startswith("UPDATE chore SET updated_at=")
+        assert "name=:name" in str(statement)
+        assert "RETURNING" in str(statement)
+        session.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_project_update_without_hours_skips_lookup(self):
+        """Test that project updates not touching hours go straight to UPDATE."""
+        session = AsyncMock()
+        session.info = {}
+        session.scalar.return_value = None
+        repository = ProjectRepository(session)
+
+        assert await repository.update(1, ProjectUpdate(name="Renamed"), 2) is None
+
+        statement = session.scalar.await_args.args[0]
+        assert str(statement).startswith("UPDATE project SET")
+        assert "project.user_id" in str(statement)
+        session.get.assert_not_called()
+
+    def test_user_select_is_built_once_per_model(self):
+        """Test that each model's per-user SELECT is cached."""
+        assert select_for_user(Chore) is select_for_user(Chore)
+        assert select_for_user(Chore) is not select_for_user(Habit)
+
+    def test_repositories_share_the_base(self):
+        """Test that the subclasses bind their own model."""
+        assert ChoreRepository.model is Chore
+        assert HabitRepository.model is Habit
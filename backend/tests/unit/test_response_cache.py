@@ -0,0 +1,177 @@
+"""
+Unit tests for the per-user response cache.
+"""
+import pytest
+from typing import List
+from unittest.mock import AsyncMock
+from fastapi.responses import ORJSONResponse
+
+from app.core.response_cache import (
+    ResponseCacheInvalidationMiddleware,
+    cached_response,
+    response_cache,
+)
+from app.core.streaming import json_array_response
+from app.models.user import User, UserRead
+
+
+class FakePipeline:
+    """Minimal stand-in for a redis pipeline."""
+
+    def __init__(self, client):
+        self.client = client
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def hset(self, name, key, value):
+        self.ops.append((name, key, value))
+
+    def expire(self, name, ttl):
+        pass
+
+    async def execute(self):
+        for name, key, value in self.ops:
+            self.client.data.setdefault(name, {})[key] = value
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for redis.asyncio.Redis."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def hget(self, name, key):
+        return self.data.get(name, {}).get(key)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def delete(self, name):
+        self.data.pop(name, None)
+
+
+@pytest.fixture
+def fake_redis():
+    """Enable the response cache against an in-memory fake."""
+    client = FakeRedis()
+    response_cache._client = client
+    yield client
+    response_cache._client = None
+
+
+def make_user(user_id):
+    """Build a user with the given ID."""
+    return User(id=user_id, username=f"user{user_id}", email=f"user{user_id}@example.com",
+                hashed_password="hashed_password", is_active=True)
+
+
+class TestCachedResponse:
+    """Test the cached_response decorator."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_calls_through(self):
+        """Test that the endpoint result is returned untouched without Redis."""
+        endpoint = AsyncMock(return_value=[])
+        wrapped = cached_response(List[UserRead])(endpoint)
+
+        assert await wrapped(current_user=make_user(1)) == []
+        endpoint.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_second_call_is_served_from_cache(self, fake_redis):
+        """Test that a repeat call for the same user skips the endpoint."""
+        user = make_user(1)
+        endpoint = AsyncMock(return_value=[user])
+        endpoint.__name__ = "list_users"
+        wrapped = cached_response(List[UserRead])(endpoint)
+
+        first = await wrapped(current_user=user)
+        second = await wrapped(current_user=user)
+
+        endpoint.assert_awaited_once()
+        assert first.body == second.body
+        assert b"hashed_password" not in first.body
+
+    @pytest.mark.asyncio
+    async def test_keys_are_per_user_and_per_argument(self, fake_redis):
+        """Test that different users and path params don't share entries."""
+        endpoint = AsyncMock(return_value={"ok": True})
+        endpoint.__name__ = "allocation"
+        wrapped = cached_response(dict)(endpoint)
+
+        await wrapped(current_user=make_user(1), goal_id=1)
+        await wrapped(current_user=make_user(1), goal_id=2)
+        await wrapped(current_user=make_user(2), goal_id=1)
+
+        assert endpoint.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_prebuilt_response_body_is_cached(self, fake_redis):
+        """Test that endpoints returning a Response have its body cached as-is."""
+        endpoint = AsyncMock(return_value=ORJSONResponse([{"id": 1}]))
+        endpoint.__name__ = "rows"
+        wrapped = cached_response(List[dict])(endpoint)
+
+        await wrapped(current_user=make_user(1))
+        cached = await wrapped(current_user=make_user(1))
+
+        endpoint.assert_awaited_once()
+        assert cached.body == b'[{"id":1}]'
+
+    @pytest.mark.asyncio
+    async def test_streamed_response_is_buffered(self, fake_redis):
+        """Test that streamed list responses are cached as their full body."""
+        async def rows():
+            yield {"id": 1}
+            yield {"id": 2}
+
+        endpoint = AsyncMock(side_effect=lambda **kwargs: json_array_response(rows()))
+        endpoint.__name__ = "streamed_rows"
+        wrapped = cached_response(List[dict])(endpoint)
+
+        first = await wrapped(current_user=make_user(1))
+        second = await wrapped(current_user=make_user(1))
+
+        endpoint.assert_awaited_once()
+        assert first.body == second.body == b'[{"id":1},{"id":2}]'
+
+
+class TestResponseCacheInvalidationMiddleware:
+    """Test ResponseCacheInvalidationMiddleware."""
+
+    def make_app(self, status_code):
+        """Build an ASGI app responding with the given status."""
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": status_code, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+        return app
+
+    @pytest.mark.asyncio
+    async def test_successful_write_invalidates(self, fake_redis):
+        """Test that a successful write drops the user's cached responses."""
+        fake_redis.data["cache:user:1"] = {"k": b"v"}
+        scope = {"type": "http", "method": "POST", "state": {"user": make_user(1)}}
+
+        await ResponseCacheInvalidationMiddleware(self.make_app(201))(scope, AsyncMock(), AsyncMock())
+
+        assert "cache:user:1" not in fake_redis.data
+
+    @pytest.mark.asyncio
+    async def test_reads_and_failed_writes_keep_cache(self, fake_redis):
+        """Test that GETs and failed writes leave the cache intact."""
+        fake_redis.data["cache:user:1"] = {"k": b"v"}
+        user = make_user(1)
+
+        await ResponseCacheInvalidationMiddleware(self.make_app(200))(
+            {"type": "http", "method": "GET", "state": {"user": user}}, AsyncMock(), AsyncMock()
+        )
+        await ResponseCacheInvalidationMiddleware(self.make_app(422))(
+            {"type": "http", "method": "PUT", "state": {"user": user}}, AsyncMock(), AsyncMock()
+        )
+
+        assert fake_redis.data["cache:user:1"] == {"k": b"v"}
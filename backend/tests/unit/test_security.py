@@ -1,16 +1,22 @@
 """
 Unit tests for security utilities.
 """
+import time
+
 import pytest
 from datetime import datetime, timedelta
-from jose import jwt
+from unittest.mock import patch
+from jose import JWTError, jwt
 
+from app.core import security
 from app.core.config import settings
 from app.core.security import (
     create_access_token,
     verify_password,
     get_password_hash,
+    run_in_password_pool,
     verify_token,
+    verify_user_password,
 )
 
 
@@ -31,6 +37,12 @@ class TestPasswordHashing:
         # Hash should start with bcrypt identifier
         assert hashed.startswith("$2b$")
     
+    def test_hash_uses_configured_rounds(self):
+        """Test that the bcrypt cost factor comes from settings."""
+        hashed = get_password_hash("test_password_123")
+        
+        assert hashed.startswith(f"$2b${settings.BCRYPT_ROUNDS:02d}$")
+    
     def test_verify_password_correct(self):
         """Test password verification with correct password."""
         password = "test_password_123"
@@ -80,6 +92,37 @@ class TestPasswordHashing:
         assert verify_password(password, hash2) is True
 
 
+class TestPasswordPool:
+    """Test offloading password hashing to the dedicated pool."""
+    
+    @pytest.mark.asyncio
+    async def test_hash_and_verify_in_pool(self):
+        """Test hashing and verifying through the password pool."""
+        hashed = await run_in_password_pool(get_password_hash, "test_password_123")
+        
+        assert await run_in_password_pool(verify_password, "test_password_123", hashed) is True
+        assert await run_in_password_pool(verify_password, "wrong_password", hashed) is False
+
+
+class TestVerifyUserPassword:
+    """Test login password verification."""
+    
+    def test_existing_user(self):
+        """Test that a stored hash is checked normally."""
+        hashed = get_password_hash("test_password_123")
+        
+        assert verify_user_password("test_password_123", hashed) is True
+        assert verify_user_password("wrong_password", hashed) is False
+    
+    def test_unknown_user_still_runs_bcrypt(self):
+        """Test that a missing user fails after checking the dummy hash."""
+        with patch.object(security, "verify_password", wraps=verify_password) as spy:
+            assert verify_user_password("any_password", None) is False
+        
+        spy.assert_called_once()
+        assert spy.call_args.args[1] == security._dummy_password_hash()
+
+
 class TestJWTTokens:
     """Test JWT token utilities."""
     
@@ -185,6 +228,52 @@ class TestJWTTokens:
         assert verified_subject is None
 
 
+class TestTokenCache:
+    """Test the verified-token LRU cache."""
+    
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start every test with an empty cache."""
+        security._token_cache.clear()
+        yield
+        security._token_cache.clear()
+    
+    def test_repeat_verification_skips_decode(self):
+        """Test that a cached token is not decoded again."""
+        token = create_access_token("42")
+        assert verify_token(token) == "42"
+        
+        with patch("app.core.security.jwt.decode") as mock_decode:
+            assert verify_token(token) == "42"
+            mock_decode.assert_not_called()
+    
+    def test_expired_entry_is_not_served(self):
+        """Test that a cached entry past its exp is re-verified."""
+        token = create_access_token("42")
+        verify_token(token)
+        key = next(iter(security._token_cache))
+        security._token_cache[key] = ("42", int(time.time()) - 1)
+        
+        with patch("app.core.security.jwt.decode", side_effect=JWTError) as mock_decode:
+            assert verify_token(token) is None
+            mock_decode.assert_called_once()
+        assert len(security._token_cache) == 0
+    
+    def test_invalid_tokens_are_not_cached(self):
+        """Test that failed verifications leave the cache untouched."""
+        verify_token("not.a.valid.jwt.token")
+        assert len(security._token_cache) == 0
+    
+    def test_cache_is_bounded(self):
+        """Test that the cache evicts the oldest entry beyond its size."""
+        with patch.object(security, "TOKEN_CACHE_SIZE", 2):
+            tokens = [create_access_token(f"user{i}") for i in range(3)]
+            for token in tokens:
+                verify_token(token)
+        
+        assert len(security._token_cache) == 2
+
+
 class TestTokenIntegration:
     """Test integration between token creation and verification."""
     
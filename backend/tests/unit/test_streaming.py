@@ -0,0 +1,46 @@
+"""
+Unit tests for streamed JSON list responses.
+"""
+import orjson
+import pytest
+from datetime import date
+
+from app.core.streaming import json_array_response
+
+
+async def collect(response):
+    """Read a streaming response's body to the end."""
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+async def aiter_rows(rows):
+    """Wrap a list as an async iterator."""
+    for row in rows:
+        yield row
+
+
+class TestJsonArrayResponse:
+    """Test json_array_response."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("count", [0, 1, 2, 5])
+    async def test_body_is_one_json_array(self, count):
+        """Test that rows are encoded as one array regardless of batching."""
+        rows = [{"id": i, "start_date": date(2024, 1, i + 1)} for i in range(count)]
+
+        body = await collect(json_array_response(aiter_rows(rows), batch_size=2))
+
+        assert orjson.loads(body) == [
+            {"id": i, "start_date": f"2024-01-0{i + 1}"} for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_chunks_follow_batch_size(self):
+        """Test that a chunk is written for every full batch."""
+        response = json_array_response(aiter_rows([{"id": i} for i in range(5)]), batch_size=2)
+
+        chunks = [chunk async for chunk in response.body_iterator]
+
+        assert len(chunks) == 3
+        assert chunks[-1].endswith(b"]")
+        assert response.media_type == "application/json"
@@ -0,0 +1,138 @@
+"""
+Unit tests for the time allocation service.
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.core.exceptions import ResourceNotFound, TimeAllocationExceeded
+from app.services.time_allocation import TimeAllocationService
+
+
+def make_session(row):
+    """Build a mock session whose next query returns the given row."""
+    result = MagicMock()
+    result.one_or_none.return_value = row
+    session = AsyncMock()
+    session.info = {}
+    session.execute.return_value = result
+    return session
+
+
+class TestForSession:
+    """Test per-session service sharing."""
+    
+    def test_same_session_shares_service(self):
+        """Test that one session always yields the same service."""
+        session = make_session(None)
+        
+        service = TimeAllocationService.for_session(session)
+        
+        assert service.session is session
+        assert TimeAllocationService.for_session(session) is service
+    
+    def test_sessions_do_not_share_services(self):
+        """Test that different sessions get different services."""
+        first = TimeAllocationService.for_session(make_session(None))
+        second = TimeAllocationService.for_session(make_session(None))
+        
+        assert first is not second
+
+
+class TestValidateGoalHoursChange:
+    """Test validate_goal_hours_change."""
+    
+    @pytest.mark.asyncio
+    async def test_within_limits(self):
+        """Test that hours fitting both project and tasks pass in one query."""
+        # project hours, other goals' hours, this goal's task hours
+        session = make_session((10.0, 3.0, 4.0))
+        
+        await TimeAllocationService(session).validate_goal_hours_change(1, 1, 7.0)
+        
+        session.execute.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_exceeds_project(self):
+        """Test that hours beyond the project's free capacity are rejected."""
+        session = make_session((10.0, 3.0, 4.0))
+        
+        with pytest.raises(TimeAllocationExceeded, match="exceed project allocation"):
+            await TimeAllocationService(session).validate_goal_hours_change(1, 1, 8.0)
+    
+    @pytest.mark.asyncio
+    async def test_below_task_hours(self):
+        """Test that hours below the goal's allocated task hours are rejected."""
+        session = make_session((10.0, 3.0, 4.0))
+        
+        with pytest.raises(TimeAllocationExceeded, match="Tasks already allocated"):
+            await TimeAllocationService(session).validate_goal_hours_change(1, 1, 3.0)
+    
+    @pytest.mark.asyncio
+    async def test_missing_project(self):
+        """Test that a missing project raises ResourceNotFound."""
+        with pytest.raises(ResourceNotFound):
+            await TimeAllocationService(make_session(None)).validate_goal_hours_change(1, 99, 5.0)
+
+
+class TestSingleQueryChecks:
+    """Test the project and goal checks that fetch everything in one query."""
+    
+    @pytest.mark.asyncio
+    async def test_goal_fits_project(self):
+        """Test that a goal within the free project capacity passes."""
+        # project hours, current goal hours
+        session = make_session((10.0, 7.0))
+        
+        await TimeAllocationService(session).validate_goal_hours_for_project(1, 3.0)
+        
+        session.execute.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_goal_exceeds_project(self):
+        """Test that a goal beyond the free project capacity is rejected."""
+        session = make_session((10.0, 7.0))
+        
+        with pytest.raises(TimeAllocationExceeded, match="exceed project allocation"):
+            await TimeAllocationService(session).validate_goal_hours_for_project(1, 4.0)
+    
+    @pytest.mark.asyncio
+    async def test_task_exceeds_goal(self):
+        """Test that a task beyond the free goal capacity is rejected."""
+        # goal hours, current task hours
+        session = make_session((4.0, 2.0))
+        
+        with pytest.raises(TimeAllocationExceeded, match="exceed goal allocation"):
+            await TimeAllocationService(session).validate_task_hours_for_goal(1, 3.0)
+        
+        session.execute.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_missing_goal(self):
+        """Test that a missing goal raises ResourceNotFound."""
+        with pytest.raises(ResourceNotFound):
+            await TimeAllocationService(make_session(None)).validate_task_hours_for_goal(99, 1.0)
+    
+    @pytest.mark.asyncio
+    async def test_project_summary(self):
+        """Test that the project summary is built from one row."""
+        # name, project hours, allocated goal hours, goal count
+        session = make_session(("Work", 10.0, 7.0, 2))
+        
+        summary = await TimeAllocationService(session).get_project_allocation_summary(1)
+        
+        session.execute.assert_awaited_once()
+        assert summary["available_hours"] == 3.0
+        assert summary["goal_count"] == 2
+        assert summary["utilization_percentage"] == 70.0
+    
+    @pytest.mark.asyncio
+    async def test_project_summary_checks_owner(self):
+        """Test that passing a user ID filters the summary query by owner."""
+        session = make_session(None)
+        
+        with pytest.raises(ResourceNotFound):
+            await TimeAllocationService(session).get_project_allocation_summary(1, user_id=2)
+        
+        statement, params = session.execute.await_args.args
+        assert "project.user_id" in str(statement)
+        assert params == {"project_id": 1, "user_id": 2}
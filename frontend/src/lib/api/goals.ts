@@ -10,7 +10,7 @@ const getAuthHeaders = () => ({
 });
 
 export const fetchGoalsByProject = async (projectId: number): Promise<Goal[]> => {
-  const response = await fetch(`${API_BASE_URL}/goals/projects/${projectId}/goals`, {
+  const response = await fetch(`${API_BASE_URL}/projects/${projectId}/goals`, {
     headers: { Authorization: `Bearer ${getToken()}` }
   });
   if (!response.ok) throw new Error('Failed to fetch goals');
@@ -33,7 +33,7 @@ export const createGoal = async (projectId: number, data: GoalFormData): Promise
     end_date: data.end_date?.toISOString().split('T')[0],
   };
 
-  const response = await fetch(`${API_BASE_URL}/goals/projects/${projectId}/goals`, {
+  const response = await fetch(`${API_BASE_URL}/projects/${projectId}/goals`, {
     method: 'POST',
     headers: getAuthHeaders(),
     body: JSON.stringify(apiData)
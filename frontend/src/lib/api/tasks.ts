@@ -10,7 +10,7 @@ const getAuthHeaders = () => ({
 });
 
 export const fetchTasksByGoal = async (goalId: number): Promise<Task[]> => {
-  const response = await fetch(`${API_BASE_URL}/tasks/goals/${goalId}/tasks`, {
+  const response = await fetch(`${API_BASE_URL}/goals/${goalId}/tasks`, {
     headers: { Authorization: `Bearer ${getToken()}` }
   });
   if (!response.ok) throw new Error('Failed to fetch tasks');
@@ -33,7 +33,7 @@ export const createTask = async (goalId: number, data: TaskFormData): Promise<Ta
     end_time: data.end_time?.toISOString(),
   };
 
-  const response = await fetch(`${API_BASE_URL}/tasks/goals/${goalId}/tasks`, {
+  const response = await fetch(`${API_BASE_URL}/goals/${goalId}/tasks`, {
     method: 'POST',
     headers: getAuthHeaders(),
     body: JSON.stringify(apiData)